@@ -16,6 +16,9 @@ class Config:
     APP_HOST = os.getenv("APP_HOST", "0.0.0.0")
     APP_PORT = int(os.getenv("APP_PORT", 5000))
     APP_DEBUG = os.getenv("APP_DEBUG", "false").lower() == "true"
+    # Flask-SocketIO async mode ("eventlet", "gevent", "threading"); unset lets Flask-SocketIO pick.
+    # eventlet/gevent need the process monkey-patched, so only use them when running the server standalone
+    SOCKETIO_ASYNC_MODE = os.getenv("SOCKETIO_ASYNC_MODE") or None
     
     # Database Configuration
     DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{BASE_DIR}/catan_evaluation.db")
@@ -24,6 +27,8 @@ class Config:
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE = Path(os.getenv("LOG_FILE", f"{BASE_DIR}/logs/catan_evaluation.log"))
     LOG_FILE.parent.mkdir(exist_ok=True)
+    # Print full LLM input/output panels to the console (slow in long tournaments)
+    VERBOSE = os.getenv("VERBOSE", "false").lower() == "true"
     
     # Game Configuration
     DEFAULT_NUM_GAMES = int(os.getenv("DEFAULT_NUM_GAMES", 10))
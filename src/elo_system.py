@@ -14,10 +14,14 @@ class EloRatingSystem:
         self.ratings: Dict[str, float] = {}
         self.game_history: List[Dict] = []
         self.ratings_file = Config.BASE_DIR / "elo_rankings.json"
+        # get_statistics() result, recomputed only after ratings or history change
+        self._stats_cache: Optional[Dict] = None
+        self._stats_dirty = True
         self.load_ratings()
     
     def load_ratings(self):
         """Load existing ratings from file"""
+        self._stats_dirty = True
         if self.ratings_file.exists():
             try:
                 with open(self.ratings_file, 'r') as f:
@@ -50,6 +54,7 @@ class EloRatingSystem:
         """Get current rating for a model"""
         if model not in self.ratings:
             self.ratings[model] = self.initial_rating
+            self._stats_dirty = True
         return self.ratings[model]
     
     def expected_score(self, rating_a: float, rating_b: float) -> float:
@@ -89,6 +94,7 @@ class EloRatingSystem:
             "loser_rating_after": self.ratings[loser]
         }
         self.game_history.append(game_record)
+        self._stats_dirty = True
         
         logger.info(f"Updated ratings - {winner}: {winner_rating:.1f} -> {self.ratings[winner]:.1f}, "
                    f"{loser}: {loser_rating:.1f} -> {self.ratings[loser]:.1f}")
@@ -114,7 +120,14 @@ class EloRatingSystem:
         }
     
     def get_statistics(self) -> Dict:
-        """Get overall statistics"""
+        """Get overall statistics (cached; callers must not mutate the result)"""
+        if self._stats_dirty or self._stats_cache is None:
+            self._stats_cache = self._compute_statistics()
+            self._stats_dirty = False
+        return self._stats_cache
+    
+    def _compute_statistics(self) -> Dict:
+        """Compute overall statistics from the game history"""
         if not self.game_history:
             return {
                 "total_games": 0,
@@ -163,6 +176,7 @@ class EloRatingSystem:
         logger.warning("Resetting all ratings")
         self.ratings = {}
         self.game_history = []
+        self._stats_dirty = True
         self.save_ratings()
 
 class TournamentScheduler:
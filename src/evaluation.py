@@ -26,6 +26,9 @@ class CatanLLMEvaluator:
         self.elo_system = EloRatingSystem()
         self.game_logs_dir = Config.BASE_DIR / "game_logs"
         self.game_logs_dir.mkdir(exist_ok=True)
+        # Kept in a subdirectory so globbing game_logs/*.json only finds full logs
+        self.game_summaries_dir = self.game_logs_dir / "summaries"
+        self.game_summaries_dir.mkdir(exist_ok=True)
         
         logger.info(f"Initialized evaluator with {len(self.models)} models")
     
@@ -468,6 +471,11 @@ class CatanLLMEvaluator:
         with open(filepath, 'w') as f:
             json.dump(game_log, f, indent=2)
         
+        # Small sidecar with just the fields the dashboard's game list needs
+        summary = {key: game_log.get(key) for key in ("game_id", "players", "winner_model", "total_turns", "start_time", "end_time")}
+        with open(self.game_summaries_dir / filename, 'w') as f:
+            json.dump(summary, f)
+        
         logger.debug(f"Saved game log to {filepath}")
     
     def run_tournament(self, games_per_matchup: int = 1) -> Dict:
@@ -1,31 +1,481 @@
+import asyncio
 import json
+import random
 import re
-from typing import List, Dict, Optional, Union
-from openai import OpenAI
+import time
+import weakref
+from collections import defaultdict
+from functools import lru_cache
+from io import StringIO
+from typing import List, Dict, Optional, Tuple
+import httpx
+import openai
+from openai import AsyncOpenAI, OpenAI
 from loguru import logger
 from catanatron.models.enums import SETTLEMENT, CITY
 from .config import Config
 from rich.console import Console
 from rich.panel import Panel
-from rich.syntax import Syntax
 
-console = Console()
+# Built on first use - Console() probes the terminal, which every worker process would pay on import
+_console = None
+
+def _get_console() -> Console:
+    """Shared rich console, created lazily"""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
+# Transient API errors worth retrying before falling back to a default move
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+    # Raised as-is while iterating a stream (e.g. ReadTimeout when a provider stalls after the headers)
+    httpx.TimeoutException,
+    httpx.TransportError,
+)
+
+# Detects a completed action_index while a response is still streaming
+_STREAM_ACTION_INDEX_RE = re.compile(r'"action_index"\s*:\s*(\d+)')
+
+# Fallback patterns for extracting a decision from free-text responses
+_JSON_OBJ_RE = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}')
+_ACTION_IDX_RE = re.compile(r'(?:action\s*(?:index)?|index|choose\s*action|choose)\s*[:=]?\s*(\d+)', re.IGNORECASE)
+_REASONING_RE = re.compile(r'"reasoning"\s*:\s*"([^"]+)"')
+_NUMBER_RE = re.compile(r'\b(\d+)\b')
+
+# httpx caps pools at 100 connections by default, which would throttle gathered requests
+ASYNC_HTTP_LIMITS = httpx.Limits(max_connections=2000, max_keepalive_connections=1500)
+
+# One connection pool per event loop, shared by every LLMClient's async path. Pooled connections
+# belong to the loop that opened them, so a later asyncio.run() gets a fresh pool
+_async_http_clients = weakref.WeakKeyDictionary()
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """Shared httpx pool for the running event loop, created lazily"""
+    loop = _running_loop()
+    client = _async_http_clients.get(loop) if loop is not None else None
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=ASYNC_HTTP_LIMITS)
+        if loop is not None:
+            _async_http_clients[loop] = client
+    return client
+
+async def aclose_async_http_client():
+    """Close the running loop's shared async pool"""
+    client = _async_http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+# Fail fast on stuck requests so the retry loop can take over instead of stalling a game.
+# Streamed responses get a longer read window since the gap between chunks can be long on
+# reasoning models; stream cancellation bounds the total time there.
+REQUEST_TIMEOUT = httpx.Timeout(60.0, connect=5.0, write=10.0, pool=5.0)
+STREAM_TIMEOUT = httpx.Timeout(120.0, connect=5.0, write=10.0, pool=5.0)
+
+# Models routed through OpenRouter that honour response_format={"type": "json_object"}
+JSON_MODE_MODELS = {
+    "openai/gpt-4o",
+    "openai/gpt-4o-mini",
+    "openai/gpt-4-turbo",
+    "openai/gpt-4.1",
+    "openai/gpt-4.1-mini",
+    "openai/gpt-3.5-turbo",
+    "openai/gpt-3.5-turbo-0125",
+    "openai/o4-mini",
+}
+
+# Hexes touched by each node, from find_correct_node_hex_mapping.py
+# These define the fixed topology of the Catan board
+_NODE_HEX_ADJACENCIES = {
+    0: frozenset({'(0, 0, 0)', '(0, 1, -1)', '(1, 0, -1)'}),
+    1: frozenset({'(0, 0, 0)', '(1, -1, 0)', '(1, 0, -1)'}),
+    2: frozenset({'(0, 0, 0)', '(1, -1, 0)', '(0, -1, 1)'}),
+    3: frozenset({'(0, 0, 0)', '(0, -1, 1)', '(-1, 0, 1)'}),
+    4: frozenset({'(0, 0, 0)', '(-1, 0, 1)', '(-1, 1, 0)'}),
+    5: frozenset({'(0, 0, 0)', '(-1, 1, 0)', '(0, 1, -1)'}),
+    6: frozenset({'(1, -1, 0)', '(1, 0, -1)', '(2, -1, -1)'}),
+    7: frozenset({'(1, -1, 0)', '(2, -2, 0)', '(2, -1, -1)'}),
+    8: frozenset({'(1, -1, 0)', '(2, -2, 0)', '(1, -2, 1)'}),
+    9: frozenset({'(1, -1, 0)', '(0, -1, 1)', '(1, -2, 1)'}),
+    10: frozenset({'(0, -1, 1)', '(1, -2, 1)', '(0, -2, 2)'}),
+    11: frozenset({'(0, -1, 1)', '(0, -2, 2)', '(-1, -1, 2)'}),
+    12: frozenset({'(0, -1, 1)', '(-1, 0, 1)', '(-1, -1, 2)'}),
+    13: frozenset({'(-1, 0, 1)', '(-1, -1, 2)', '(-2, 0, 2)'}),
+    14: frozenset({'(-1, 0, 1)', '(-2, 0, 2)', '(-2, 1, 1)'}),
+    15: frozenset({'(-1, 0, 1)', '(-1, 1, 0)', '(-2, 1, 1)'}),
+    16: frozenset({'(-1, 1, 0)', '(0, 1, -1)', '(-1, 2, -1)'}),
+    17: frozenset({'(-1, 1, 0)', '(-2, 1, 1)', '(-2, 2, 0)'}),
+    18: frozenset({'(-1, 1, 0)', '(-2, 2, 0)', '(-1, 2, -1)'}),
+    19: frozenset({'(0, 1, -1)', '(0, 2, -2)', '(1, 1, -2)'}),
+    20: frozenset({'(0, 1, -1)', '(1, 0, -1)', '(1, 1, -2)'}),
+    21: frozenset({'(0, 1, -1)', '(-1, 2, -1)', '(0, 2, -2)'}),
+    22: frozenset({'(1, 0, -1)', '(1, 1, -2)', '(2, 0, -2)'}),
+    23: frozenset({'(1, 0, -1)', '(2, 0, -2)', '(2, -1, -1)'}),
+    30: frozenset({'(1, -2, 1)', '(0, -2, 2)'}),
+    35: frozenset({'(-1, -1, 2)', '(-2, 0, 2)'}),
+    37: frozenset({'(-2, 0, 2)', '(-2, 1, 1)'}),
+    40: frozenset({'(-2, 2, 0)', '(-1, 2, -1)'}),
+    45: frozenset({'(0, 2, -2)', '(1, 1, -2)'}),
+    47: frozenset({'(1, 1, -2)', '(2, 0, -2)'}),
+    50: frozenset({'(2, 0, -2)', '(2, -1, -1)'})
+}
+
+# Nodes described during initial placement (good starting positions)
+_NODES_TO_SHOW = (0, 1, 2, 3, 4, 5, 7, 8, 9, 10, 11, 12, 13, 14, 15,
+                  16, 17, 18, 19, 20, 21, 22, 23, 30, 35, 37, 40, 45, 47, 50)
+
+# Inverted index so each prompt only walks the hexes once
+_coord_to_nodes = defaultdict(list)
+for _node_id in _NODES_TO_SHOW:
+    for _coord in _NODE_HEX_ADJACENCIES[_node_id]:
+        _coord_to_nodes[_coord].append(_node_id)
+# Frozen into a plain dict of tuples so prompt formatting can't mutate it
+_COORD_TO_NODES = {coord: tuple(nodes) for coord, nodes in _coord_to_nodes.items()}
+del _coord_to_nodes, _node_id, _coord
+
+# Explanation of the board layout, at the top of every prompt
+_BOARD_GUIDE = """=== CATAN BOARD SPATIAL GUIDE ===
+
+The board has 19 hexes arranged in a honeycomb pattern:
+- Center hex (0) is surrounded by 6 hexes (1-6)
+- Outer ring has 12 hexes (7-18)
+- Each hex has 6 vertices (nodes) and 6 edges
+
+NODE REFERENCE:
+- Node 0: Center of board (touches hexes 0,5,6)
+- Nodes 1-5: Inner ring around center hex
+- Nodes 6-23: Middle ring positions
+- Nodes 24-53: Coastal positions
+
+PORT LOCATIONS (2:1 specialized trading):
+- Nodes 52-53: SHEEP port (trade 2 sheep for 1 any)
+- Nodes 35-36: WOOD port
+- Nodes 32-33: WHEAT port
+- Nodes 40-44: BRICK port
+- Nodes 28-29: ORE port
+- Other coastal pairs: 3:1 ports (trade 3 of same for 1 any)
+
+ADJACENCY PATTERNS:
+- Adjacent nodes have consecutive numbers along edges
+- E.g., node 0 connects to nodes 1,5,20
+- E.g., node 7 connects to nodes 6,8,24
+
+
+"""
+
+# System prompts are module constants so the request prefix is byte-identical on every call
+_SYSTEM_PROMPT_INTRO = """You are an expert Settlers of Catan player. You will be given the current game state and a list of legal actions.
+        
+Your task is to choose the best action from the legal actions list. Consider:
+1. Resource optimization and diversification
+2. Strategic positioning on the board
+3. Blocking opponents
+4. Victory point progression
+5. Trade opportunities
+
+"""
+
+_SYSTEM_PROMPT = _SYSTEM_PROMPT_INTRO + """You MUST respond with ONLY a valid JSON object in this exact format:
+{"action_index": 0, "reasoning": "Brief explanation"}
+
+Where:
+- action_index: An integer from 0 to (number of legal actions - 1)
+- reasoning: A brief string explaining your choice
+
+Do not include any text before or after the JSON object. The response must be valid JSON that can be parsed."""
+
+# JSON mode guarantees a parseable object, so only the schema is needed
+_JSON_MODE_SYSTEM_PROMPT = _SYSTEM_PROMPT_INTRO + """Respond with a JSON object: {"action_index": <integer from 0 to (number of legal actions - 1)>, "reasoning": "<brief explanation>"}"""
+
+# Rules that hold for every turn of every match, kept ahead of the game state
+_GAME_RULES = """=== GAME RULES ===
+- 1v1 game; the first player to reach 10 victory points wins
+- Road: 1 wood + 1 brick
+- Settlement (1 VP): 1 wood + 1 brick + 1 sheep + 1 wheat
+- City (2 VP, replaces a settlement): 2 wheat + 3 ore
+- Development card: 1 sheep + 1 wheat + 1 ore
+- Longest road (5+ segments) and largest army (3+ knights) are worth 2 VP each
+- Rolling a 7 moves the robber; players holding more than 7 cards discard half
+
+"""
+
+# Extracts the edge from "Action(COLOR BUILD_ROAD (n1, n2))"
+_BUILD_ROAD_RAW_RE = re.compile(r'BUILD_ROAD\s*(\([^)]*\))')
+
+# Action types with a dedicated description; anything else is shown with its raw string
+_DESCRIBED_ACTION_TYPES = frozenset({
+    "BUILD_SETTLEMENT", "BUILD_ROAD", "BUILD_CITY", "BUY_DEVELOPMENT_CARD",
+    "PLAY_KNIGHT", "PLAY_KNIGHT_CARD", "MOVE_ROBBER", "TRADE", "MARITIME_TRADE",
+    "END_TURN", "ROLL", "DISCARD", "PLAY_MONOPOLY", "PLAY_YEAR_OF_PLENTY", "PLAY_ROAD_BUILDING"
+})
+
+@lru_cache(maxsize=4096)
+def _describe_action(action_type, node, edge, coordinate, steal_from, params, raw) -> str:
+    """Describe an action from its hashable fields (actions repeat across turns, so this is memoized)"""
+    # Handle Catanatron action types
+    if action_type == "BUILD_SETTLEMENT":
+        return f"Build settlement at node {node}"
+    elif action_type == "BUILD_ROAD":
+        # Fallback: try to extract from raw string if edge not found
+        if not edge and raw:
+            match = _BUILD_ROAD_RAW_RE.search(raw)
+            if match:
+                edge = match.group(1)
+        
+        if not edge:
+            edge = 'Unknown'
+            logger.warning(f"Could not find edge in BUILD_ROAD action. Raw: {raw}")
+        
+        return f"Build road on edge {edge}"
+    elif action_type == "BUILD_CITY":
+        return f"Upgrade settlement to city at node {node}"
+    elif action_type == "BUY_DEVELOPMENT_CARD":
+        return "Buy development card"
+    elif action_type in ["PLAY_KNIGHT", "PLAY_KNIGHT_CARD"]:
+        return "Play knight card"
+    elif action_type == "MOVE_ROBBER":
+        if steal_from:
+            return f"Move robber to {coordinate} and steal from {steal_from}"
+        else:
+            return f"Move robber to {coordinate}"
+    elif action_type in ["TRADE", "MARITIME_TRADE"]:
+        return f"Trade resources {params}" if params else "Trade resources"
+    elif action_type == "END_TURN":
+        return "End turn"
+    elif action_type == "ROLL":
+        return "Roll dice"
+    elif action_type == "DISCARD":
+        return "Discard cards"
+    elif action_type == "PLAY_MONOPOLY":
+        return "Play monopoly card"
+    elif action_type == "PLAY_YEAR_OF_PLENTY":
+        return "Play year of plenty card"
+    else:
+        return "Play road building card"
+
+# Splits "Action(COLOR ACTION_TYPE params)" the way str.split(" ", 2) would
+_ACTION_RE = re.compile(r'Action\(([^ ]*) ([^ ]*)(?: (.*))?\)', re.DOTALL)
+
+def _parse_node(action_data: Dict, params: str):
+    """Settlement/city node id, kept as a string if it isn't an integer"""
+    try:
+        action_data["node"] = int(params)
+    except ValueError:
+        action_data["node"] = params
+
+def _parse_edge(action_data: Dict, params: str):
+    """Road edge, kept as its "(node1, node2)" string"""
+    action_data["edge"] = params
+    logger.debug("BUILD_ROAD action: raw={}, edge={}", action_data["raw"], params)
+
+def _parse_params(action_data: Dict, params: str):
+    """Robber and trade parameters, passed through unparsed"""
+    action_data["params"] = params
+
+# Per-type parameter parsers for _convert_actions; other types drop their params
+_ACTION_PARSERS = {
+    "BUILD_SETTLEMENT": _parse_node,
+    "BUILD_CITY": _parse_node,
+    "BUILD_ROAD": _parse_edge,
+    "MOVE_ROBBER": _parse_params,
+    "MARITIME_TRADE": _parse_params,
+    "TRADE": _parse_params,
+}
+
+# Static field tables for Catanatron's flat player_state ("P{i}_<SUFFIX>") keys
+_RESOURCE_FIELDS = (
+    ("wood", "WOOD_IN_HAND"),
+    ("brick", "BRICK_IN_HAND"),
+    ("sheep", "SHEEP_IN_HAND"),
+    ("wheat", "WHEAT_IN_HAND"),
+    ("ore", "ORE_IN_HAND"),
+)
+_DEV_CARD_FIELDS = (
+    ("knight", "KNIGHT_IN_HAND"),
+    ("victory_point", "VICTORY_POINT_IN_HAND"),
+    ("road_building", "ROAD_BUILDING_IN_HAND"),
+    ("year_of_plenty", "YEAR_OF_PLENTY_IN_HAND"),
+    ("monopoly", "MONOPOLY_IN_HAND"),
+)
+_PLAYED_CARD_FIELDS = (
+    ("played_knight", "PLAYED_KNIGHT"),
+    ("played_road_building", "PLAYED_ROAD_BUILDING"),
+    ("played_year_of_plenty", "PLAYED_YEAR_OF_PLENTY"),
+    ("played_monopoly", "PLAYED_MONOPOLY"),
+)
+_STATUS_FIELDS = (
+    ("victory_points", "VICTORY_POINTS"),
+    ("actual_victory_points", "ACTUAL_VICTORY_POINTS"),
+    ("has_longest_road", "HAS_ROAD"),
+    ("has_largest_army", "HAS_ARMY"),
+    ("longest_road_length", "LONGEST_ROAD_LENGTH"),
+    ("has_rolled", "HAS_ROLLED"),
+    ("has_played_dev_card", "HAS_PLAYED_DEVELOPMENT_CARD_IN_TURN"),
+)
+
+# Fully-formatted player_state keys for each player index, built once at import
+_PLAYER_KEYS = [
+    {
+        group: tuple((name, f"P{i}_{suffix}") for name, suffix in fields)
+        for group, fields in (
+            ("resources", _RESOURCE_FIELDS),
+            ("dev_cards", _DEV_CARD_FIELDS),
+            ("played", _PLAYED_CARD_FIELDS),
+            ("status", _STATUS_FIELDS),
+        )
+    }
+    for i in range(4)
+]
+
+# Action types that are always offered to the model, however long the action list gets
+_PRIORITY_ACTION_TYPES = frozenset({"BUILD_CITY", "BUILD_SETTLEMENT", "BUY_DEVELOPMENT_CARD"})
+
+def _sample_evenly(indices: List[int], slots: int) -> List[int]:
+    """Pick up to slots indices spread evenly across the list"""
+    if slots <= 0:
+        return []
+    if len(indices) <= slots:
+        return indices
+    step = len(indices) / slots
+    return [indices[int(j * step)] for j in range(slots)]
+
+def _prune_actions(legal_actions: List[Dict], k: int = 20) -> Tuple[List[Dict], List[int]]:
+    """Reduce a long action list to at most k entries.
+    
+    The first action of every type is kept, then the remaining victory-point actions,
+    then the redundant variants (extra road edges, maritime trades, ...) fill whatever
+    slots are left; each group is sampled evenly when it does not fit. Returns the kept
+    actions and their original indices.
+    """
+    n = len(legal_actions)
+    if n <= k:
+        return legal_actions, list(range(n))
+    
+    firsts = []
+    priority = []
+    rest = []
+    seen_types = set()
+    for i, action in enumerate(legal_actions):
+        action_type = action.get("type")
+        if action_type not in seen_types:
+            firsts.append(i)
+            seen_types.add(action_type)
+        elif action_type in _PRIORITY_ACTION_TYPES:
+            priority.append(i)
+        else:
+            rest.append(i)
+    
+    keep = _sample_evenly(firsts, k)
+    keep += _sample_evenly(priority, k - len(keep))
+    keep += _sample_evenly(rest, k - len(keep))
+    
+    index_map = sorted(keep)
+    return [legal_actions[i] for i in index_map], index_map
+
+def _move_schema(n_actions: int) -> Dict:
+    """JSON schema constraining a move to a valid index into the legal actions"""
+    return {
+        "type": "object",
+        "properties": {
+            "action_index": {"type": "integer", "minimum": 0, "maximum": n_actions - 1},
+            "reasoning": {"type": "string"}
+        },
+        "required": ["action_index", "reasoning"],
+        "additionalProperties": False
+    }
+
+def _resource_str(resource) -> str:
+    """Normalize a tile resource - it might be a string, an enum or None (desert)"""
+    if hasattr(resource, 'value'):
+        return resource.value
+    return str(resource) if resource else "desert"
 
 class LLMClient:
     """Unified client for interacting with LLMs through OpenRouter"""
     
-    def __init__(self, model: str, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        model: str,
+        api_key: Optional[str] = None,
+        keep_raw: bool = False,
+        json_mode: bool = True,
+        max_actions: int = 20,
+        http_client: Optional[httpx.AsyncClient] = None,
+        stream: bool = True,
+        max_stream_tokens: int = 4096
+    ):
         self.model = model
         self.api_key = api_key or Config.OPENROUTER_API_KEY
+        # Attach the raw completion text to each decision (debugging only)
+        self._keep_raw = keep_raw
+        # Use the provider's JSON mode where supported instead of parsing free text
+        self._json_mode = json_mode and model in JSON_MODE_MODELS
+        # Cap on legal actions listed in the prompt (see _prune_actions)
+        self._max_actions = max_actions
+        # Prefer strict structured outputs; drops to plain JSON mode if the provider rejects them
+        self._json_schema = self._json_mode
         
-        # Initialize synchronous OpenAI client
+        # Initialize synchronous OpenAI client (retries are handled in _call_llm)
         self.client = OpenAI(
             base_url=Config.OPENROUTER_BASE_URL,
-            api_key=self.api_key
+            api_key=self.api_key,
+            timeout=REQUEST_TIMEOUT,
+            max_retries=0
         )
         
+        # Async client is built on first use; without an explicit http_client it uses the module-wide pool
+        self._http_client = http_client
+        self._aclient = None
+        self._aclient_loop = None
+        
+        # Stream completions and stop reading once the decision object is complete
+        self._stream = stream
+        self._max_stream_tokens = max_stream_tokens
+        
+        # Retry policy for transient errors (exponential backoff with jitter)
+        self._max_retries = 6
+        self._max_sleep = 30
+        # Total retries across all requests, for tuning request rate against OpenRouter limits
+        self.retry_count = 0
+        
+        # The system message is identical on every request, so build it once
+        system_prompt = _JSON_MODE_SYSTEM_PROMPT if self._json_mode else _SYSTEM_PROMPT
+        self._system_message = {"role": "system", "content": system_prompt}
+        # Anthropic only caches prompt prefixes that are explicitly marked, and only past
+        # 1024 tokens, so the breakpoint goes after the static rules/board part of the prompt
+        self._mark_cache_prefix = model.startswith("anthropic/")
+        
+        # Board hexes never change within a game, so the rendered section is cached
+        self._static_hexes = None
+        self._static_prompt = None
+        
         logger.info(f"Initialized LLM client for model: {model}")
     
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """AsyncOpenAI client for concurrent move requests, created lazily per event loop"""
+        loop = _running_loop()
+        if self._aclient is None or self._aclient_loop is None or self._aclient_loop() is not loop:
+            self._aclient_loop = weakref.ref(loop) if loop is not None else None
+            self._aclient = AsyncOpenAI(
+                base_url=Config.OPENROUTER_BASE_URL,
+                api_key=self.api_key,
+                timeout=REQUEST_TIMEOUT,
+                max_retries=0,
+                http_client=self._http_client or _get_async_http_client()
+            )
+        return self._aclient
+    
     def get_move(
         self,
         game_state: Dict,
@@ -33,126 +483,450 @@ class LLMClient:
         game_history: Optional[List[Dict]] = None
     ) -> Dict:
         """Get the next move from the LLM given the game state"""
+        # Forced moves need no model call
+        if len(legal_actions) == 1:
+            return self._forced_move(legal_actions)
         
-        # Create system prompt
-        system_prompt = """You are an expert Settlers of Catan player. You will be given the current game state and a list of legal actions.
+        shown_actions, index_map = self._select_actions(legal_actions)
+        messages = self._build_messages(game_state, shown_actions, game_history)
         
-Your task is to choose the best action from the legal actions list. Consider:
-1. Resource optimization and diversification
-2. Strategic positioning on the board
-3. Blocking opponents
-4. Victory point progression
-5. Trade opportunities
-
-You MUST respond with ONLY a valid JSON object in this exact format:
-{"action_index": 0, "reasoning": "Brief explanation"}
-
-Where:
-- action_index: An integer from 0 to (number of legal actions - 1)
-- reasoning: A brief string explaining your choice
-
-Do not include any text before or after the JSON object. The response must be valid JSON that can be parsed."""
+        try:
+            content = self._call_llm(messages, len(shown_actions))
+            decision = self._handle_response(content, shown_actions, self._prompt_len(messages))
+            return self._restore_index(decision, legal_actions, index_map)
+        except Exception as e:
+            return self._fallback_move(legal_actions, e)
+    
+    async def aget_move(
+        self,
+        game_state: Dict,
+        legal_actions: List[Dict],
+        game_history: Optional[List[Dict]] = None
+    ) -> Dict:
+        """Async variant of get_move so tournament runners can gather many moves concurrently"""
+        # Forced moves need no model call
+        if len(legal_actions) == 1:
+            return self._forced_move(legal_actions)
         
-        # Format game state for LLM
-        user_prompt = self._format_game_state(game_state, legal_actions, game_history)
+        shown_actions, index_map = self._select_actions(legal_actions)
+        messages = self._build_messages(game_state, shown_actions, game_history)
         
-        # Color based on model name
-        color = "cyan" if "o4-mini" in self.model else "magenta"
+        try:
+            content = await self._acall_llm(messages, len(shown_actions))
+            decision = self._handle_response(content, shown_actions, self._prompt_len(messages))
+            return self._restore_index(decision, legal_actions, index_map)
+        except Exception as e:
+            return self._fallback_move(legal_actions, e)
+    
+    async def get_moves_batch(
+        self,
+        positions: Dict[str, Tuple[Dict, List[Dict]]],
+        poll_interval: float = 30.0
+    ) -> Dict[str, Dict]:
+        """Decide moves for many recorded positions through the Batch API.
+        
+        positions maps a custom id (e.g. "game3_turn17_p0") to (game_state, legal_actions).
+        Batches complete asynchronously within 24h at reduced cost, so this suits offline
+        evaluation of saved positions rather than live games. Requires an OpenAI-compatible
+        endpoint that implements /v1/files and /v1/batches.
+        """
+        requests = []
+        index_maps = {}
+        for custom_id, (game_state, legal_actions) in positions.items():
+            shown_actions, index_maps[custom_id] = self._select_actions(legal_actions)
+            messages = self._build_messages(game_state, shown_actions)
+            requests.append(self._batch_request(custom_id, messages, len(shown_actions)))
+        
+        batch_id = await self.submit_batch(requests)
+        contents = await self.retrieve_batch_results(batch_id, poll_interval)
+        
+        decisions = {}
+        for custom_id, (game_state, legal_actions) in positions.items():
+            shown_actions = [legal_actions[i] for i in index_maps[custom_id]]
+            try:
+                decision = self._handle_response(contents[custom_id], shown_actions, 0)
+                decisions[custom_id] = self._restore_index(decision, legal_actions, index_maps[custom_id])
+            except Exception as e:
+                decisions[custom_id] = self._fallback_move(legal_actions, e)
+        return decisions
+    
+    def _batch_request(self, custom_id: str, messages: List[Dict], n_actions: int) -> Dict:
+        """One JSONL line of a Batch API input file"""
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": self._request_kwargs(messages, n_actions)
+        }
+    
+    async def submit_batch(self, requests: List[Dict]) -> str:
+        """Upload batch requests as a JSONL file and start the batch, returning its id"""
+        payload = "\n".join(json.dumps(request) for request in requests).encode("utf-8")
+        batch_file = await self.aclient.files.create(file=("catan_moves.jsonl", payload), purpose="batch")
+        batch = await self.aclient.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(requests)} requests for {self.model}")
+        return batch.id
+    
+    async def poll_batch(self, batch_id: str, poll_interval: float = 30.0):
+        """Wait until a batch reaches a terminal status and return it"""
+        while True:
+            batch = await self.aclient.batches.retrieve(batch_id)
+            if batch.status in ("completed", "failed", "expired", "cancelled"):
+                return batch
+            await asyncio.sleep(poll_interval)
+    
+    async def retrieve_batch_results(self, batch_id: str, poll_interval: float = 30.0) -> Dict[str, str]:
+        """Wait for a batch and return the completion text for each custom id"""
+        batch = await self.poll_batch(batch_id, poll_interval)
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch_id} finished with status {batch.status}")
+        
+        output = await self.aclient.files.content(batch.output_file_id)
+        contents = {}
+        for line in output.text.splitlines():
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                contents[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+            else:
+                logger.warning(f"Batch request {record['custom_id']} failed: {record.get('error')}")
+        return contents
+    
+    def _build_messages(
+        self,
+        game_state: Dict,
+        legal_actions: List[Dict],
+        game_history: Optional[List[Dict]] = None
+    ) -> List[Dict]:
+        """Build the chat messages for a move request"""
+        
+        # Format game state for LLM
+        static_prompt = self._format_static_prefix(game_state)
+        dynamic_prompt = self._format_game_state(game_state, legal_actions, game_history)
+        user_prompt = static_prompt + dynamic_prompt
         
         # Log the input
-        console.print(Panel(
-            f"[bold {color}]🤖 {self.model} - INPUT[/bold {color}]\n\n" + 
-            user_prompt[:500] + ("..." if len(user_prompt) > 500 else ""),
-            border_style=color
-        ))
+        if Config.VERBOSE:
+            color = self._log_color()
+            _get_console().print(Panel(
+                f"[bold {color}]🤖 {self.model} - INPUT[/bold {color}]\n\n" + 
+                user_prompt[:500] + ("..." if len(user_prompt) > 500 else ""),
+                border_style=color
+            ))
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.7
-                # No max_tokens limit - let models use as many as they need
-                # No response_format - we'll parse JSON manually
-            )
-            
-            # Parse response
-            content = response.choices[0].message.content.strip()
-            
-            # Log the output
-            console.print(Panel(
+        if self._mark_cache_prefix:
+            user_content = [
+                {"type": "text", "text": static_prompt, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": dynamic_prompt},
+            ]
+        else:
+            user_content = user_prompt
+        
+        return [
+            self._system_message,
+            {"role": "user", "content": user_content}
+        ]
+    
+    def _prompt_len(self, messages: List[Dict]) -> int:
+        """Length of the user prompt, whether sent as a string or as content blocks"""
+        content = messages[-1]["content"]
+        if isinstance(content, str):
+            return len(content)
+        return sum(len(block["text"]) for block in content)
+    
+    def _handle_response(self, content: str, legal_actions: List[Dict], prompt_len: int) -> Dict:
+        """Parse and validate a completion into a move decision"""
+        color = self._log_color()
+        
+        # Parse response
+        content = content.strip()
+        
+        # Log the output
+        if Config.VERBOSE:
+            _get_console().print(Panel(
                 f"[bold {color}]🤖 {self.model} - OUTPUT[/bold {color}]\n\n{content}",
                 border_style=color
             ))
-            
-            # Try to extract JSON from the response
-            # Sometimes models add extra text despite instructions
+        
+        if self._json_mode:
             try:
-                # First try direct parsing
                 decision = json.loads(content)
             except json.JSONDecodeError:
-                # Try to find JSON object in the response
-                import re
-                # Look for JSON that might be embedded in text, handle nested braces
-                json_candidates = re.findall(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', content)
-                
-                decision = None
-                for candidate in json_candidates:
-                    if '"action_index"' in candidate:
-                        try:
-                            decision = json.loads(candidate)
-                            break
-                        except json.JSONDecodeError:
-                            continue
-                
-                if not decision:
-                    # Try to find action_index mentioned in text
-                    # Look for patterns like "action index 0", "choose action 0", "index: 0", etc.
-                    action_match = re.search(r'(?:action\s*(?:index)?|index|choose\s*action|choose)\s*[:=]?\s*(\d+)', content, re.IGNORECASE)
-                    if action_match:
-                        action_index = int(action_match.group(1))
-                        # Extract reasoning if possible
-                        reasoning_match = re.search(r'"reasoning"\s*:\s*"([^"]+)"', content)
-                        reasoning = reasoning_match.group(1) if reasoning_match else "Extracted from text response"
-                        decision = {"action_index": action_index, "reasoning": reasoning}
-                    else:
-                        # Last resort - find the first number
-                        number_match = re.search(r'\b(\d+)\b', content)
-                        if number_match:
-                            action_index = int(number_match.group(1))
-                            decision = {"action_index": action_index, "reasoning": "Extracted first number from response"}
-                        else:
-                            decision = {"action_index": 0, "reasoning": "Could not parse response - defaulting to first action"}
-            
-            # Validate action index
-            action_index = decision.get("action_index", 0)
-            if not isinstance(action_index, int) or not 0 <= action_index < len(legal_actions):
-                logger.warning(f"Invalid action index {action_index}, defaulting to 0")
-                action_index = 0
-            
-            # Log the chosen action
-            chosen_action = legal_actions[action_index]
-            console.print(f"[bold {color}]➡️  {self.model} chose: {self._format_action(chosen_action)}[/bold {color}]\n")
+                # Truncated or wrapped output - salvage what we can rather than defaulting
+                logger.warning(f"{self.model} returned invalid JSON in JSON mode, parsing as text")
+                decision = self._parse_decision(content)
+        else:
+            decision = self._parse_decision(content)
+        
+        # Validate action index
+        action_index = decision.get("action_index", 0)
+        if not isinstance(action_index, int) or not 0 <= action_index < len(legal_actions):
+            logger.warning(f"Invalid action index {action_index}, defaulting to 0")
+            action_index = 0
+        
+        if not Config.VERBOSE:
+            logger.info(f"{self.model} input_len={prompt_len} output_len={len(content)} action_index={action_index}")
+        
+        # Log the chosen action
+        chosen_action = legal_actions[action_index]
+        _get_console().print(f"[bold {color}]➡️  {self.model} chose: {self._format_action(chosen_action)}[/bold {color}]\n")
+        
+        result = {
+            "action": chosen_action,
+            "action_index": action_index,
+            "reasoning": decision.get("reasoning", "No reasoning provided"),
+            "model": self.model
+        }
+        if self._keep_raw:
+            result["raw_response"] = content
+        return result
+    
+    def _select_actions(self, legal_actions: List[Dict]):
+        """Trim long action lists, returning the shown actions and their original indices"""
+        shown_actions, index_map = _prune_actions(legal_actions, self._max_actions)
+        if len(shown_actions) < len(legal_actions):
+            logger.info(f"{self.model} pruned legal actions {len(legal_actions)} -> {len(shown_actions)} "
+                        f"({len(shown_actions) / len(legal_actions):.0%})")
+        return shown_actions, index_map
+    
+    def _restore_index(self, decision: Dict, legal_actions: List[Dict], index_map: List[int]) -> Dict:
+        """Map a decision made over the pruned actions back onto the full legal action list"""
+        action_index = index_map[decision["action_index"]]
+        decision["action_index"] = action_index
+        decision["action"] = legal_actions[action_index]
+        return decision
+    
+    def _forced_move(self, legal_actions: List[Dict]) -> Dict:
+        """Decision for a turn with exactly one legal action"""
+        return {
+            "action": legal_actions[0],
+            "action_index": 0,
+            "reasoning": "Only one legal action",
+            "model": self.model
+        }
+    
+    def _fallback_move(self, legal_actions: List[Dict], error: Exception) -> Dict:
+        """Return the first legal action when the model could not be queried"""
+        logger.error(f"Error getting move from {self.model}: {error}")
+        return {
+            "action": legal_actions[0],
+            "action_index": 0,
+            "reasoning": f"Error occurred, defaulting to first legal action: {error}",
+            "model": self.model
+        }
+    
+    def _log_color(self) -> str:
+        """Console color based on model name"""
+        return "cyan" if "o4-mini" in self.model else "magenta"
+    
+    def _parse_decision(self, content: str) -> Dict:
+        """Extract the decision from a free-text response"""
+        # Sometimes models add extra text despite instructions
+        try:
+            # First try direct parsing
+            decision = json.loads(content)
+        except json.JSONDecodeError:
+            # Look for JSON that might be embedded in text, handle nested braces
+            json_candidates = _JSON_OBJ_RE.findall(content)
             
-            return {
-                "action": chosen_action,
-                "action_index": action_index,
-                "reasoning": decision.get("reasoning", "No reasoning provided"),
-                "model": self.model,
-                "raw_response": content  # Keep for debugging
-            }
+            decision = None
+            for candidate in json_candidates:
+                if '"action_index"' in candidate:
+                    try:
+                        decision = json.loads(candidate)
+                        break
+                    except json.JSONDecodeError:
+                        continue
             
-        except Exception as e:
-            logger.error(f"Error getting move from {self.model}: {e}")
-            # Return first legal action as fallback
-            return {
-                "action": legal_actions[0],
-                "action_index": 0,
-                "reasoning": f"Error occurred, defaulting to first legal action: {e}",
-                "model": self.model
+            if not decision:
+                # Try to find action_index mentioned in text
+                # Look for patterns like "action index 0", "choose action 0", "index: 0", etc.
+                action_match = _ACTION_IDX_RE.search(content)
+                if action_match:
+                    action_index = int(action_match.group(1))
+                    # Extract reasoning if possible
+                    reasoning_match = _REASONING_RE.search(content)
+                    reasoning = reasoning_match.group(1) if reasoning_match else "Extracted from text response"
+                    decision = {"action_index": action_index, "reasoning": reasoning}
+                else:
+                    # Last resort - find the first number
+                    number_match = _NUMBER_RE.search(content)
+                    if number_match:
+                        action_index = int(number_match.group(1))
+                        decision = {"action_index": action_index, "reasoning": "Extracted first number from response"}
+                    else:
+                        decision = {"action_index": 0, "reasoning": "Could not parse response - defaulting to first action"}
+        
+        return decision
+    
+    def _request_kwargs(self, messages: List[Dict], n_actions: int) -> Dict:
+        """Arguments for chat.completions.create shared by the sync and async paths"""
+        # No max_tokens limit - let models use as many as they need
+        kwargs = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": 0.7
+        }
+        if self._json_schema:
+            kwargs["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": "catan_move", "schema": _move_schema(n_actions), "strict": True}
             }
+        elif self._json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+        return kwargs
+    
+    def _downgrade_schema(self, error: Exception):
+        """Switch to plain JSON mode after the provider rejects a strict schema"""
+        # Other 400s (context length, bad params) must not turn structured outputs off for good
+        details = f"{getattr(error, 'param', None)} {getattr(error, 'body', None)} {error}".lower()
+        if not self._json_schema or ("response_format" not in details and "json_schema" not in details):
+            raise error
+        logger.warning(f"{self.model} rejected the JSON schema ({error}), falling back to JSON mode")
+        self._json_schema = False
+    
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """Backoff delay before the next attempt; re-raises once retries are exhausted"""
+        if attempt == self._max_retries - 1:
+            logger.error(f"{self.model} request failed after {self._max_retries} attempts, giving up")
+            raise error
+        self.retry_count += 1
+        delay = min(self._max_sleep, (2 ** attempt) + random.random())
+        logger.warning(f"{self.model} request failed ({type(error).__name__}), "
+                       f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self._max_retries})")
+        return delay
+    
+    def _call_llm(self, messages: List[Dict], n_actions: int):
+        """Call the chat completions API, retrying transient errors with backoff"""
+        # Loop ends by returning or by _retry_delay/_downgrade_schema raising; a schema
+        # downgrade (at most once) is retried immediately and doesn't use up an attempt
+        attempt = 0
+        while True:
+            kwargs = self._request_kwargs(messages, n_actions)
+            try:
+                if self._stream:
+                    content = self._read_stream(self.client.chat.completions.create(stream=True, timeout=STREAM_TIMEOUT, **kwargs))
+                else:
+                    response = self.client.chat.completions.create(**kwargs)
+                    content = response.choices[0].message.content or ""
+            except openai.BadRequestError as e:
+                self._downgrade_schema(e)
+                continue
+            except RETRYABLE_ERRORS as e:
+                time.sleep(self._retry_delay(attempt, e))
+                attempt += 1
+                continue
+            self._log_recovery(attempt)
+            return content
+    
+    async def _acall_llm(self, messages: List[Dict], n_actions: int):
+        """Async counterpart of _call_llm using the shared AsyncOpenAI client"""
+        attempt = 0
+        while True:
+            kwargs = self._request_kwargs(messages, n_actions)
+            try:
+                if self._stream:
+                    content = await self._aread_stream(await self.aclient.chat.completions.create(stream=True, timeout=STREAM_TIMEOUT, **kwargs))
+                else:
+                    response = await self.aclient.chat.completions.create(**kwargs)
+                    content = response.choices[0].message.content or ""
+            except openai.BadRequestError as e:
+                self._downgrade_schema(e)
+                continue
+            except RETRYABLE_ERRORS as e:
+                await asyncio.sleep(self._retry_delay(attempt, e))
+                attempt += 1
+                continue
+            self._log_recovery(attempt)
+            return content
+    
+    def _read_stream(self, stream) -> str:
+        """Accumulate a streamed completion, closing the stream once the decision is complete"""
+        parts = []
+        scan_state = (0, False, False)
+        try:
+            for n_chunks, chunk in enumerate(stream, 1):
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text:
+                    scan_state, done = self._scan_chunk(parts, text, scan_state)
+                    if done:
+                        break
+                if n_chunks >= self._max_stream_tokens:
+                    logger.warning(f"{self.model} stream hit the {self._max_stream_tokens} token cap")
+                    break
+        finally:
+            stream.close()
+        return "".join(parts)
+    
+    async def _aread_stream(self, stream) -> str:
+        """Async counterpart of _read_stream"""
+        parts = []
+        scan_state = (0, False, False)
+        n_chunks = 0
+        try:
+            async for chunk in stream:
+                n_chunks += 1
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text:
+                    scan_state, done = self._scan_chunk(parts, text, scan_state)
+                    if done:
+                        break
+                if n_chunks >= self._max_stream_tokens:
+                    logger.warning(f"{self.model} stream hit the {self._max_stream_tokens} token cap")
+                    break
+        finally:
+            await stream.close()
+        return "".join(parts)
+    
+    def _scan_chunk(self, parts: List[str], text: str, state: Tuple[int, bool, bool]):
+        """Append a streamed chunk and report whether a complete decision object has arrived
+        
+        state is (brace depth, inside a JSON string, last char was a backslash) so that braces
+        inside string values like the reasoning don't end the stream early.
+        """
+        parts.append(text)
+        depth, in_string, escaped = state
+        closed = False
+        for ch in text:
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                # Quotes in prose around the object aren't JSON strings
+                in_string = depth > 0
+            elif ch == "{":
+                depth += 1
+            elif ch == "}" and depth:
+                depth -= 1
+                closed = closed or depth == 0
+        # Only rescan the buffer when a closing brace brings us back to the top level
+        done = depth == 0 and closed and _STREAM_ACTION_INDEX_RE.search("".join(parts)) is not None
+        return (depth, in_string, escaped), done
+    
+    def _log_recovery(self, attempt: int):
+        """Log requests that only succeeded after retrying"""
+        if attempt:
+            logger.info(f"{self.model} request succeeded after {attempt} retries "
+                        f"({self.retry_count} retries this session)")
+    
+    def _format_static_prefix(self, game_state: Dict) -> str:
+        """Format the part of the prompt that is stable across turns.
+        
+        Rules and board guide never change and the board layout is fixed per game, so
+        this goes first and the prompt prefix can be served from the provider's cache.
+        """
+        prefix = _GAME_RULES + _BOARD_GUIDE
+        if "board" in game_state:
+            prefix += self._format_static_board(game_state["board"].get("hexes", [])) + "\n"
+        return prefix
     
     def _format_game_state(
         self,
@@ -160,133 +934,51 @@ Do not include any text before or after the JSON object. The response must be va
         legal_actions: List[Dict],
         game_history: Optional[List[Dict]] = None
     ) -> str:
-        """Format game state into a prompt for the LLM"""
-        
-        prompt_parts = []
-        
-        # Add comprehensive board layout explanation
-        if game_state.get('turn', 0) <= 4:  # Initial placement phase
-            prompt_parts.append("=== CATAN BOARD SPATIAL GUIDE ===")
-            prompt_parts.append("\nThe board has 19 hexes arranged in a honeycomb pattern:")
-            prompt_parts.append("- Center hex (0) is surrounded by 6 hexes (1-6)")
-            prompt_parts.append("- Outer ring has 12 hexes (7-18)")
-            prompt_parts.append("- Each hex has 6 vertices (nodes) and 6 edges")
-            prompt_parts.append("")
-            prompt_parts.append("NODE REFERENCE:")
-            prompt_parts.append("- Node 0: Center of board (touches hexes 0,5,6)")
-            prompt_parts.append("- Nodes 1-5: Inner ring around center hex")
-            prompt_parts.append("- Nodes 6-23: Middle ring positions")
-            prompt_parts.append("- Nodes 24-53: Coastal positions")
-            prompt_parts.append("")
-            prompt_parts.append("PORT LOCATIONS (2:1 specialized trading):")
-            prompt_parts.append("- Nodes 52-53: SHEEP port (trade 2 sheep for 1 any)")
-            prompt_parts.append("- Nodes 35-36: WOOD port")  
-            prompt_parts.append("- Nodes 32-33: WHEAT port")
-            prompt_parts.append("- Nodes 40-44: BRICK port")
-            prompt_parts.append("- Nodes 28-29: ORE port")
-            prompt_parts.append("- Other coastal pairs: 3:1 ports (trade 3 of same for 1 any)")
-            prompt_parts.append("")
-            prompt_parts.append("ADJACENCY PATTERNS:")
-            prompt_parts.append("- Adjacent nodes have consecutive numbers along edges")
-            prompt_parts.append("- E.g., node 0 connects to nodes 1,5,20")
-            prompt_parts.append("- E.g., node 7 connects to nodes 6,8,24")
-            prompt_parts.append("")
-            prompt_parts.append("")
+        """Format the per-turn game state that follows the static prefix in the prompt"""
+        
+        buf = StringIO()
+        write = buf.write
         
         # Current game state
-        prompt_parts.append("=== CURRENT GAME STATE ===")
-        prompt_parts.append(f"Turn: {game_state.get('turn', 0)}")
-        prompt_parts.append(f"Current Player: {game_state.get('current_player', 'Unknown')}")
+        write(
+            "=== CURRENT GAME STATE ===\n"
+            f"Turn: {game_state.get('turn', 0)}\n"
+            f"Current Player: {game_state.get('current_player', 'Unknown')}\n"
+        )
         
         # Player resources and scores
         if "players" in game_state:
-            prompt_parts.append("\n=== PLAYER STATUS ===")
+            write("\n=== PLAYER STATUS ===\n")
             for player_id, player_data in game_state["players"].items():
-                prompt_parts.append(f"\nPlayer {player_id}:")
-                prompt_parts.append(f"  Victory Points: {player_data.get('victory_points', 0)}")
-                prompt_parts.append(f"  Resources: {player_data.get('resources', {})}")
-                prompt_parts.append(f"  Development Cards: {player_data.get('dev_cards_count', 0)}")
-                prompt_parts.append(f"  Settlements: {player_data.get('settlements', 0)}")
-                prompt_parts.append(f"  Cities: {player_data.get('cities', 0)}")
-                prompt_parts.append(f"  Roads Built: {player_data.get('roads', 0)}")
-                prompt_parts.append(f"  Longest Road: {player_data.get('longest_road_length', 0)}")
-        
-        # Board state summary
+                pd_get = player_data.get
+                write(
+                    f"\nPlayer {player_id}:\n"
+                    f"  Victory Points: {pd_get('victory_points', 0)}\n"
+                    f"  Resources: {pd_get('resources', {})}\n"
+                    f"  Development Cards: {pd_get('dev_cards_count', 0)}\n"
+                    f"  Settlements: {pd_get('settlements', 0)}\n"
+                    f"  Cities: {pd_get('cities', 0)}\n"
+                    f"  Roads Built: {pd_get('roads', 0)}\n"
+                    f"  Longest Road: {pd_get('longest_road_length', 0)}\n"
+                )
+        
+        # Dynamic board state summary
         if "board" in game_state:
-            prompt_parts.append("\n=== BOARD STATE ===")
-            
-            # Hex tiles
+            write("\n=== BOARD POSITION ===\n")
             hexes = game_state["board"].get("hexes", [])
-            if hexes:
-                prompt_parts.append("\nResource Hexes:")
-                for hex_info in hexes[:19]:  # Standard Catan has 19 hexes
-                    if hex_info["resource"] != "desert":
-                        prompt_parts.append(f"  {hex_info['coordinate']}: {hex_info['resource']} (number: {hex_info['number']})")
-                    else:
-                        prompt_parts.append(f"  {hex_info['coordinate']}: desert")
             
-            prompt_parts.append(f"\nRobber Location: {game_state['board'].get('robber_location', 'Unknown')}")
+            write(f"\nRobber Location: {game_state['board'].get('robber_location', 'Unknown')}\n")
             
             # Add detailed hex information for initial placement
             if game_state.get('turn', 0) <= 4 and hexes:
-                prompt_parts.append("\nKey Node-Hex Relationships:")
-                # Show some important nodes and what they touch
-                hex_by_coord = {h['cube_coord']: h for h in hexes if 'cube_coord' in h}
+                write("\nKey Node-Hex Relationships:\n")
                 # The hardcoded approach doesn't work because of board randomization
                 # Instead, provide information for all buildable nodes dynamically
-                # Nodes to show in initial placement (good starting positions)
-                nodes_to_show = [0, 1, 2, 3, 4, 5, 7, 8, 9, 10, 11, 12, 13, 14, 15, 
-                               16, 17, 18, 19, 20, 21, 22, 23, 30, 35, 37, 40, 45, 47, 50]
-                
                 # For each node, find what hexes it actually touches in THIS game
-                # by checking all hexes and seeing which ones are adjacent
                 node_hex_mapping = {}
-                for node_id in nodes_to_show:
-                    adjacent_hexes = []
-                    # Check each hex to see if this node is adjacent to it
-                    for hex_info in hexes:
-                        cube_coord = hex_info.get('cube_coord', '')
-                        # Use the hardcoded adjacency patterns from find_correct_node_hex_mapping.py
-                        # These define the fixed topology of the Catan board
-                        node_adjacencies = {
-                            0: ['(0, 0, 0)', '(0, 1, -1)', '(1, 0, -1)'],
-                            1: ['(0, 0, 0)', '(1, -1, 0)', '(1, 0, -1)'],
-                            2: ['(0, 0, 0)', '(1, -1, 0)', '(0, -1, 1)'],
-                            3: ['(0, 0, 0)', '(0, -1, 1)', '(-1, 0, 1)'],
-                            4: ['(0, 0, 0)', '(-1, 0, 1)', '(-1, 1, 0)'],
-                            5: ['(0, 0, 0)', '(-1, 1, 0)', '(0, 1, -1)'],
-                            6: ['(1, -1, 0)', '(1, 0, -1)', '(2, -1, -1)'],
-                            7: ['(1, -1, 0)', '(2, -2, 0)', '(2, -1, -1)'],
-                            8: ['(1, -1, 0)', '(2, -2, 0)', '(1, -2, 1)'],
-                            9: ['(1, -1, 0)', '(0, -1, 1)', '(1, -2, 1)'],
-                            10: ['(0, -1, 1)', '(1, -2, 1)', '(0, -2, 2)'],
-                            11: ['(0, -1, 1)', '(0, -2, 2)', '(-1, -1, 2)'],
-                            12: ['(0, -1, 1)', '(-1, 0, 1)', '(-1, -1, 2)'],
-                            13: ['(-1, 0, 1)', '(-1, -1, 2)', '(-2, 0, 2)'],
-                            14: ['(-1, 0, 1)', '(-2, 0, 2)', '(-2, 1, 1)'],
-                            15: ['(-1, 0, 1)', '(-1, 1, 0)', '(-2, 1, 1)'],
-                            16: ['(-1, 1, 0)', '(0, 1, -1)', '(-1, 2, -1)'],
-                            17: ['(-1, 1, 0)', '(-2, 1, 1)', '(-2, 2, 0)'],
-                            18: ['(-1, 1, 0)', '(-2, 2, 0)', '(-1, 2, -1)'],
-                            19: ['(0, 1, -1)', '(0, 2, -2)', '(1, 1, -2)'],
-                            20: ['(0, 1, -1)', '(1, 0, -1)', '(1, 1, -2)'],
-                            21: ['(0, 1, -1)', '(-1, 2, -1)', '(0, 2, -2)'],
-                            22: ['(1, 0, -1)', '(1, 1, -2)', '(2, 0, -2)'],
-                            23: ['(1, 0, -1)', '(2, 0, -2)', '(2, -1, -1)'],
-                            30: ['(1, -2, 1)', '(0, -2, 2)'],
-                            35: ['(-1, -1, 2)', '(-2, 0, 2)'],
-                            37: ['(-2, 0, 2)', '(-2, 1, 1)'],
-                            40: ['(-2, 2, 0)', '(-1, 2, -1)'],
-                            45: ['(0, 2, -2)', '(1, 1, -2)'],
-                            47: ['(1, 1, -2)', '(2, 0, -2)'],
-                            50: ['(2, 0, -2)', '(2, -1, -1)']
-                        }
-                        
-                        if node_id in node_adjacencies and cube_coord in node_adjacencies[node_id]:
-                            adjacent_hexes.append(hex_info)
-                    
-                    if adjacent_hexes:
-                        node_hex_mapping[node_id] = adjacent_hexes
+                for hex_info in hexes:
+                    for node_id in _COORD_TO_NODES.get(hex_info.get('cube_coord', ''), ()):
+                        node_hex_mapping.setdefault(node_id, []).append(hex_info)
                 
                 # Now format the node information with actual resources
                 for node_id, adjacent_hexes in sorted(node_hex_mapping.items()):
@@ -297,7 +989,7 @@ Do not include any text before or after the JSON object. The response must be va
                         else:
                             resources.append("desert")
                     if resources:
-                        prompt_parts.append(f"  Node {node_id}: adjacent to {', '.join(resources)}")
+                        write(f"  Node {node_id}: adjacent to {', '.join(resources)}\n")
             
             # Current buildings
             settlements = game_state["board"].get("settlements", [])
@@ -305,108 +997,87 @@ Do not include any text before or after the JSON object. The response must be va
             roads = game_state["board"].get("roads", [])
             
             if settlements:
-                prompt_parts.append(f"\nSettlements on board: {len(settlements)}")
-                for s in settlements[:5]:  # Show first 5
-                    prompt_parts.append(f"  Node {s['node']}: {s['owner']}")
-                if len(settlements) > 5:
-                    prompt_parts.append(f"  ... and {len(settlements) - 5} more")
+                n_settlements = len(settlements)
+                write(f"\nSettlements on board: {n_settlements}\n")
+                # Show first 5
+                write("".join(f"  Node {s['node']}: {s['owner']}\n" for s in settlements[:5]))
+                if n_settlements > 5:
+                    write(f"  ... and {n_settlements - 5} more\n")
             
             if cities:
-                prompt_parts.append(f"\nCities on board: {len(cities)}")
-                for c in cities[:3]:  # Show first 3
-                    prompt_parts.append(f"  Node {c['node']}: {c['owner']}")
+                write(f"\nCities on board: {len(cities)}\n")
+                # Show first 3
+                write("".join(f"  Node {c['node']}: {c['owner']}\n" for c in cities[:3]))
             
             if roads:
-                prompt_parts.append(f"\nTotal roads on board: {len(roads)}")
+                write(f"\nTotal roads on board: {len(roads)}\n")
         
         # Recent history
         if game_history and len(game_history) > 0:
-            prompt_parts.append("\n=== RECENT ACTIONS ===")
-            for action in game_history[-5:]:  # Last 5 actions
-                prompt_parts.append(f"- {action.get('player', 'Unknown')}: {action.get('action_type', 'Unknown')}")
+            write("\n=== RECENT ACTIONS ===\n")
+            # Last 5 actions
+            write("".join(
+                f"- {action.get('player', 'Unknown')}: {action.get('action_type', 'Unknown')}\n"
+                for action in game_history[-5:]
+            ))
         
         # Legal actions
-        prompt_parts.append("\n=== LEGAL ACTIONS ===")
-        prompt_parts.append(f"You have {len(legal_actions)} legal actions available:")
-        for i, action in enumerate(legal_actions):
-            action_str = self._format_action(action)
-            prompt_parts.append(f"{i}: {action_str}")
+        write("\n=== LEGAL ACTIONS ===\n")
+        write(f"You have {len(legal_actions)} legal actions available:\n")
+        format_action = self._format_action
+        write("".join(f"{i}: {format_action(action)}\n" for i, action in enumerate(legal_actions)))
         
-        prompt_parts.append("\nChoose the best action by its index number.")
+        write("\nChoose the best action by its index number.")
         
-        return "\n".join(prompt_parts)
+        return buf.getvalue()
+    
+    def _format_static_board(self, hexes: List[Dict]) -> str:
+        """Format the board hexes, reusing the cached text while the board is unchanged"""
+        if self._static_prompt is not None and hexes == self._static_hexes:
+            return self._static_prompt
+        
+        prompt_parts = ["=== BOARD STATE ==="]
+        if hexes:
+            prompt_parts.append("\nResource Hexes:")
+            board_hexes = hexes[:19]  # Standard Catan has 19 hexes
+            resource_lines = []
+            desert_lines = []
+            for h in board_hexes:
+                if h["resource"] != "desert":
+                    resource_lines.append(f"  {h['coordinate']}: {h['resource']} (number: {h['number']})")
+                elif not desert_lines:
+                    desert_lines.append(f"  {h['coordinate']}: desert")
+            prompt_parts.append("\n".join(resource_lines + desert_lines))
+        prompt_parts.append("")
+        
+        self._static_hexes = hexes
+        self._static_prompt = "\n".join(prompt_parts)
+        return self._static_prompt
     
     def _format_action(self, action: Dict) -> str:
         """Format a single action for display"""
         action_type = action.get("type", "Unknown")
-        
-        # Debug log to see what we're getting
-        if action_type == "BUILD_ROAD" and "edge" not in action:
-            logger.debug(f"BUILD_ROAD action missing edge key. Full action: {action}")
-        
-        # Handle Catanatron action types
-        if action_type == "BUILD_SETTLEMENT":
-            node = action.get('node', 'Unknown')
-            # Add hints for key positions during initial placement
-            hint = ""
-            # Removed hints - models should figure out what's good themselves
-            return f"Build settlement at node {node}{hint}"
-        elif action_type == "BUILD_ROAD":
-            edge = action.get('edge', None)
-            
-            # Try different keys where edge might be stored
-            if not edge:
-                edge = action.get('value', None) or action.get('params', None)
-            
-            # Fallback: try to extract from raw string if edge not found
-            if not edge and 'raw' in action:
-                raw = action['raw']
-                # Extract edge from "Action(COLOR BUILD_ROAD (n1, n2))"
-                if 'BUILD_ROAD' in raw and '(' in raw and ')' in raw:
-                    try:
-                        edge_part = raw.split('BUILD_ROAD')[1].strip()
-                        if edge_part.startswith('(') and ')' in edge_part:
-                            edge = edge_part[:edge_part.index(')')+1]
-                    except:
-                        pass
-            
-            if not edge:
-                edge = 'Unknown'
-                # Log what keys we have for debugging
-                logger.warning(f"Could not find edge in BUILD_ROAD action. Keys: {list(action.keys())}, Action: {action}")
-            
-            return f"Build road on edge {edge}"
-        elif action_type == "BUILD_CITY":
-            return f"Upgrade settlement to city at node {action.get('node', 'Unknown')}"
-        elif action_type == "BUY_DEVELOPMENT_CARD":
-            return "Buy development card"
-        elif action_type in ["PLAY_KNIGHT", "PLAY_KNIGHT_CARD"]:
-            return "Play knight card"
-        elif action_type == "MOVE_ROBBER":
-            coordinate = action.get('coordinate', action.get('params', 'Unknown'))
-            steal_from = action.get('steal_from', '')
-            if steal_from:
-                return f"Move robber to {coordinate} and steal from {steal_from}"
-            else:
-                return f"Move robber to {coordinate}"
-        elif action_type in ["TRADE", "MARITIME_TRADE"]:
-            params = action.get('params', '')
-            return f"Trade resources {params}" if params else "Trade resources"
-        elif action_type == "END_TURN":
-            return "End turn"
-        elif action_type == "ROLL":
-            return "Roll dice"
-        elif action_type == "DISCARD":
-            return "Discard cards"
-        elif action_type == "PLAY_MONOPOLY":
-            return "Play monopoly card"
-        elif action_type == "PLAY_YEAR_OF_PLENTY":
-            return "Play year of plenty card"
-        elif action_type == "PLAY_ROAD_BUILDING":
-            return "Play road building card"
-        else:
+        if action_type not in _DESCRIBED_ACTION_TYPES:
             # Include raw action for unknown types
             return f"{action_type} ({action.get('raw', '')})"
+        
+        # Try different keys where a road's edge might be stored
+        edge = action.get('edge') or action.get('value') or action.get('params')
+        key = (
+            action_type,
+            action.get('node', 'Unknown'),
+            edge,
+            action.get('coordinate', action.get('params', 'Unknown')),
+            action.get('steal_from', ''),
+            action.get('params', ''),
+            # The raw string is only needed to recover a missing road edge
+            action.get('raw') if action_type == "BUILD_ROAD" and not edge else None
+        )
+        try:
+            return _describe_action(*key)
+        except TypeError:
+            # Unhashable parameters (e.g. lists) bypass the cache
+            return _describe_action.__wrapped__(*key)
 
 class LLMPlayer:
     """Wrapper to make LLMClient compatible with Catanatron's player interface"""
@@ -416,14 +1087,24 @@ class LLMPlayer:
         self.model = model
         self.llm_client = LLMClient(model)
         self.name = f"LLM-{model.split('/')[-1]}"
+        # Board extraction reused across decide() calls (see _get_board_info)
+        self._state_cache = {}
     
     def get_move(self, game_state, legal_actions, game_history=None):
         """Get move with reasoning for the evaluation system"""
         # This is already in the correct format
         return self.llm_client.get_move(game_state, legal_actions, game_history)
     
+    async def aget_move(self, game_state, legal_actions, game_history=None):
+        """Async get_move for runners that evaluate several games concurrently"""
+        return await self.llm_client.aget_move(game_state, legal_actions, game_history)
+    
     def decide(self, game, playable_actions):
         """Synchronous decide method for Catanatron compatibility"""
+        # Forced moves skip state conversion and the model call entirely
+        if len(playable_actions) == 1:
+            return playable_actions[0]
+        
         # Convert Catanatron game state to our format
         game_state = self._convert_game_state(game)
         legal_actions = self._convert_actions(playable_actions)
@@ -445,40 +1126,38 @@ class LLMPlayer:
                 longest_road = state.player_state[f"P{i}_LONGEST_ROAD_LENGTH"]
                 logger.debug(f"Turn {state.num_turns} - {color.value}: Roads built={roads_built}, Longest road={longest_road}")
         
+        # Bucket roads by owner in one pass
+        # Note: Catanatron might store roads as both (A,B) and (B,A), so we need to deduplicate
+        roads_by_color = defaultdict(set)
+        if hasattr(state, 'board') and hasattr(state.board, 'roads'):
+            for edge, road_color in state.board.roads.items():
+                # Normalize edge to avoid double counting (always use smaller node first)
+                if isinstance(edge, tuple) and len(edge) == 2 and edge[1] < edge[0]:
+                    edge = (edge[1], edge[0])
+                roads_by_color[road_color].add(edge)
+        
         # Extract player information
         players = {}
+        ps = state.player_state
         for i, color in enumerate(state.colors):
+            pk = _PLAYER_KEYS[i]
             player_state = {}
             
             # Resources - these keys always exist
-            player_state["resources"] = {
-                "wood": state.player_state[f"P{i}_WOOD_IN_HAND"],
-                "brick": state.player_state[f"P{i}_BRICK_IN_HAND"],
-                "sheep": state.player_state[f"P{i}_SHEEP_IN_HAND"],
-                "wheat": state.player_state[f"P{i}_WHEAT_IN_HAND"],
-                "ore": state.player_state[f"P{i}_ORE_IN_HAND"]
-            }
+            player_state["resources"] = {name: ps[key] for name, key in pk["resources"]}
             
             # Development cards - full breakdown
-            player_state["dev_cards"] = {
-                "knight": state.player_state[f"P{i}_KNIGHT_IN_HAND"],
-                "victory_point": state.player_state[f"P{i}_VICTORY_POINT_IN_HAND"],
-                "road_building": state.player_state[f"P{i}_ROAD_BUILDING_IN_HAND"],
-                "year_of_plenty": state.player_state[f"P{i}_YEAR_OF_PLENTY_IN_HAND"],
-                "monopoly": state.player_state[f"P{i}_MONOPOLY_IN_HAND"]
-            }
+            player_state["dev_cards"] = {name: ps[key] for name, key in pk["dev_cards"]}
             player_state["dev_cards_count"] = sum(player_state["dev_cards"].values())
             
             # Played development cards
-            player_state["played_knight"] = state.player_state[f"P{i}_PLAYED_KNIGHT"]
-            player_state["played_road_building"] = state.player_state[f"P{i}_PLAYED_ROAD_BUILDING"]
-            player_state["played_year_of_plenty"] = state.player_state[f"P{i}_PLAYED_YEAR_OF_PLENTY"]
-            player_state["played_monopoly"] = state.player_state[f"P{i}_PLAYED_MONOPOLY"]
+            for name, key in pk["played"]:
+                player_state[name] = ps[key]
             
             # Buildings - count actual buildings on the board for this player
             player_state["settlements"] = 0
             player_state["cities"] = 0
-            player_state["roads"] = 0
+            player_state["roads"] = len(roads_by_color.get(color, ()))
             
             # Count settlements and cities from buildings_by_color
             if hasattr(state, 'buildings_by_color') and color in state.buildings_by_color:
@@ -486,75 +1165,66 @@ class LLMPlayer:
                 player_state["settlements"] = len(buildings.get(SETTLEMENT, []))
                 player_state["cities"] = len(buildings.get(CITY, []))
             
-            # Count roads from board.roads
-            # Note: Catanatron might store roads as both (A,B) and (B,A), so we need to deduplicate
-            if hasattr(state, 'board') and hasattr(state.board, 'roads'):
-                player_roads = set()
-                for edge, road_color in state.board.roads.items():
-                    if road_color == color:
-                        # Normalize edge to avoid double counting (always use smaller node first)
-                        if isinstance(edge, tuple) and len(edge) == 2:
-                            normalized_edge = tuple(sorted(edge))
-                            player_roads.add(normalized_edge)
-                        else:
-                            player_roads.add(edge)
-                player_state["roads"] = len(player_roads)
-            
-            # Victory points and special achievements
-            player_state["victory_points"] = state.player_state[f"P{i}_VICTORY_POINTS"]
-            player_state["actual_victory_points"] = state.player_state[f"P{i}_ACTUAL_VICTORY_POINTS"]
-            player_state["has_longest_road"] = state.player_state[f"P{i}_HAS_ROAD"]
-            player_state["has_largest_army"] = state.player_state[f"P{i}_HAS_ARMY"]
-            player_state["longest_road_length"] = state.player_state[f"P{i}_LONGEST_ROAD_LENGTH"]
-            
-            # Turn state
-            player_state["has_rolled"] = state.player_state[f"P{i}_HAS_ROLLED"]
-            player_state["has_played_dev_card"] = state.player_state[f"P{i}_HAS_PLAYED_DEVELOPMENT_CARD_IN_TURN"]
+            # Victory points, special achievements and turn state
+            for name, key in pk["status"]:
+                player_state[name] = ps[key]
             
             players[color.value] = player_state
         
-        # Extract board information
-        board_info = {
-            "hexes": self._get_hex_info(state),
-            "robber_location": self._get_robber_location(state),
-            "ports": self._get_port_info(state),
-            "settlements": self._get_settlement_info(state),
-            "cities": self._get_city_info(state),
-            "roads": self._get_road_info(state)
-        }
-        
         return {
             "turn": state.num_turns,
             "current_player": state.colors[state.current_player_index].value,
             "current_player_index": state.current_player_index,
             "players": players,
-            "board": board_info,
+            "board": self._get_board_info(state),
             "is_initial_build_phase": state.is_initial_build_phase,
             "resource_bank": state.resource_freqdeck if hasattr(state, 'resource_freqdeck') else None
         }
     
+    def _get_board_info(self, state):
+        """Extract board information, reusing parts that have not changed since the last call"""
+        cache = self._state_cache
+        
+        # Hexes and ports are fixed for the lifetime of a map. The map itself is held rather
+        # than its id(), which a new map can reuse once the old one is garbage collected
+        board_map = getattr(state.board, 'map', None)
+        if "map" not in cache or cache["map"] is not board_map:
+            cache.clear()
+            cache["map"] = board_map
+            cache["hexes"] = self._get_hex_info(state)
+            cache["ports"] = self._get_port_info(state)
+        
+        # Buildings only change when an action is played (state.actions is append-only)
+        n_actions = len(state.actions)
+        if cache.get("n_actions") != n_actions:
+            cache["n_actions"] = n_actions
+            cache["settlements"] = self._get_settlement_info(state)
+            cache["cities"] = self._get_city_info(state)
+            cache["roads"] = self._get_road_info(state)
+        
+        return {
+            "hexes": cache["hexes"],
+            "robber_location": self._get_robber_location(state),
+            "ports": cache["ports"],
+            "settlements": cache["settlements"],
+            "cities": cache["cities"],
+            "roads": cache["roads"]
+        }
+    
     def _get_hex_info(self, state):
         """Get information about hex tiles"""
-        hex_info = []
         # Catanatron uses a coordinate system for hexes
-        if hasattr(state.board, 'map') and hasattr(state.board.map, 'land_tiles'):
-            for coord, tile in state.board.map.land_tiles.items():
-                resource = tile.resource
-                # Handle resource - it might be a string or enum
-                if hasattr(resource, 'value'):
-                    resource_str = resource.value
-                elif resource:
-                    resource_str = str(resource)
-                else:
-                    resource_str = "desert"
-                
-                hex_data = {
-                    "coordinate": str(coord),
-                    "resource": resource_str,
-                    "number": tile.number if hasattr(tile, 'number') else None
-                }
-                hex_info.append(hex_data)
-        return hex_info
+        if not (hasattr(state.board, 'map') and hasattr(state.board.map, 'land_tiles')):
+            return []
+        return [
+            {
+                # Left as a tuple - it is only stringified when the board prompt is rendered
+                "coordinate": coord,
+                "resource": _resource_str(tile.resource),
+                "number": tile.number if hasattr(tile, 'number') else None
+            }
+            for coord, tile in state.board.map.land_tiles.items()
+        ]
     
     def _get_robber_location(self, state):
         """Get current robber location"""
@@ -576,84 +1246,56 @@ class LLMPlayer:
     
     def _get_settlement_info(self, state):
         """Get all settlements on the board"""
-        settlements = []
-        if hasattr(state, 'buildings_by_color'):
-            for color, buildings in state.buildings_by_color.items():
-                # buildings is a defaultdict(list)
-                settlement_nodes = buildings.get(SETTLEMENT, []) if hasattr(buildings, 'get') else []
-                for node_id in settlement_nodes:
-                    settlements.append({
-                        "node": node_id,
-                        "owner": color.value
-                    })
-        return settlements
+        if not hasattr(state, 'buildings_by_color'):
+            return []
+        # buildings is a defaultdict(list)
+        return [
+            {"node": node_id, "owner": color.value}
+            for color, buildings in state.buildings_by_color.items()
+            for node_id in buildings.get(SETTLEMENT, ())
+        ]
     
     def _get_city_info(self, state):
         """Get all cities on the board"""
-        cities = []
-        if hasattr(state, 'buildings_by_color'):
-            for color, buildings in state.buildings_by_color.items():
-                # buildings is a defaultdict(list)
-                city_nodes = buildings.get(CITY, []) if hasattr(buildings, 'get') else []
-                for node_id in city_nodes:
-                    cities.append({
-                        "node": node_id,
-                        "owner": color.value
-                    })
-        return cities
+        if not hasattr(state, 'buildings_by_color'):
+            return []
+        # buildings is a defaultdict(list)
+        return [
+            {"node": node_id, "owner": color.value}
+            for color, buildings in state.buildings_by_color.items()
+            for node_id in buildings.get(CITY, ())
+        ]
     
     def _get_road_info(self, state):
         """Get all roads on the board"""
-        roads = []
-        if hasattr(state, 'board') and hasattr(state.board, 'roads'):
-            # Roads are stored in board.roads as {edge: color}
-            for edge, color in state.board.roads.items():
-                roads.append({
-                    "edge": str(edge),
-                    "owner": color.value
-                })
-        return roads
+        if not (hasattr(state, 'board') and hasattr(state.board, 'roads')):
+            return []
+        # Roads are stored in board.roads as {edge: color}
+        return [
+            {"edge": str(edge), "owner": color.value}
+            for edge, color in state.board.roads.items()
+        ]
     
     def _convert_actions(self, playable_actions):
         """Convert Catanatron actions to our format"""
         converted = []
         for action in playable_actions:
             # Actions come as Action objects with string representation
+            # Example: "Action(RED BUILD_SETTLEMENT 0)"
             action_str = str(action)
             action_data = {"raw": action_str}
             
-            # Parse the action string format: "Action(COLOR ACTION_TYPE params)"
-            # Example: "Action(RED BUILD_SETTLEMENT 0)"
-            if action_str.startswith("Action(") and action_str.endswith(")"):
-                content = action_str[7:-1]  # Remove "Action(" and ")"
-                parts = content.split(" ", 2)  # Split into at most 3 parts
-                
-                if len(parts) >= 2:
-                    color = parts[0]
-                    action_type = parts[1]
-                    action_data["color"] = color
-                    action_data["type"] = action_type
-                    
-                    # Parse parameters based on action type
-                    if len(parts) > 2:
-                        params = parts[2]
-                        
-                        if action_type == "BUILD_SETTLEMENT":
-                            action_data["node"] = int(params) if params.isdigit() else params
-                        elif action_type == "BUILD_ROAD":
-                            # Road format: "(node1, node2)"
-                            action_data["edge"] = params
-                            # Debug: log what we're getting
-                            logger.debug(f"BUILD_ROAD action: raw={action_str}, edge={params}")
-                        elif action_type == "BUILD_CITY":
-                            action_data["node"] = int(params) if params.isdigit() else params
-                        elif action_type == "MOVE_ROBBER":
-                            # Parse robber move parameters
-                            action_data["params"] = params
-                        elif action_type in ["MARITIME_TRADE", "TRADE"]:
-                            action_data["params"] = params
-                else:
-                    action_data["type"] = content
+            match = _ACTION_RE.fullmatch(action_str)
+            if match:
+                color, action_type, params = match.groups()
+                action_data["color"] = color
+                action_data["type"] = action_type
+                if params is not None:
+                    parser = _ACTION_PARSERS.get(action_type)
+                    if parser:
+                        parser(action_data, params)
+            elif action_str.startswith("Action(") and action_str.endswith(")"):
+                action_data["type"] = action_str[7:-1]
             else:
                 # Fallback for other action formats
                 action_data["type"] = action_str
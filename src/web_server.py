@@ -1,25 +1,132 @@
-from flask import Flask, render_template, jsonify, send_from_directory, request
+from flask import Flask, Response, render_template, jsonify, send_from_directory, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from flask_socketio import SocketIO, emit
-import json
+from flask_compress import Compress
+from flask_socketio import SocketIO, emit, join_room
+import hashlib
+import heapq
+import msgpack
+import orjson
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from functools import lru_cache, wraps
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 from loguru import logger
 
 from .config import Config
 from .elo_system import EloRatingSystem
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__, 
     static_folder='../web/static',
     template_folder='../web/templates'
 )
+app.json = OrjsonProvider(app)
+# Game logs and rankings are large, repetitive JSON - compress anything over 1 KB
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
 CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=Config.SOCKETIO_ASYNC_MODE)
 
 # Global state
 elo_system = EloRatingSystem()
 active_games = {}
 
+# Action updates are buffered per game and broadcast together every BROADCAST_INTERVAL seconds
+BROADCAST_INTERVAL = 0.05
+_pending_actions = defaultdict(deque)
+# Held while draining+emitting a batch and while emitting lifecycle events, so a batch the
+# broadcaster already drained can't be sent after the game_end that follows it
+_broadcast_lock = threading.RLock()
+
+# Files and directories read by the API endpoints
+_GAME_LOGS_DIR = Config.BASE_DIR / "game_logs"
+_GAME_SUMMARIES_DIR = _GAME_LOGS_DIR / "summaries"
+_ELO_FILE = Config.BASE_DIR / "elo_rankings.json"
+_PROGRESS_FILE = Config.BASE_DIR / "tournament_progress.json"
+_PROGRESS_LOG = _PROGRESS_FILE.with_suffix(".jsonl")
+
+# Encoded bodies of the dashboard endpoints: key -> (expires_at, bytes, etag)
+_cache = {}
+RESPONSE_TTL = 5.0
+
+# Parsed /api/games summaries: file path -> (mtime_ns, summary); game logs are written once
+_game_summary_cache = {}
+
+def _encode_event(payload) -> bytes:
+    """Serialize a websocket payload once as MessagePack; bytes go out as a binary attachment"""
+    return msgpack.packb(payload, default=str)
+
+def _json_response(obj, status: int = 200) -> Response:
+    """Encode straight to bytes, bypassing Flask's str-based jsonify path"""
+    return Response(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), status=status, mimetype='application/json')
+
+@lru_cache(maxsize=8)
+def _load_json(path: str, mtime_ns: int):
+    """Parse a JSON file; mtime_ns is part of the key, so a rewritten file is re-read"""
+    return orjson.loads(Path(path).read_bytes())
+
+@lru_cache(maxsize=4)
+def _count_lines(path: str, mtime_ns: int) -> int:
+    """Count the readable lines in a JSONL file, keyed on mtime like _load_json"""
+    count = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            # A torn last line from a killed run is skipped on load, so it isn't counted either
+            try:
+                orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            count += 1
+    return count
+
+def _etag_matches(etag: str) -> bool:
+    """Whether If-None-Match carries etag, including the "<etag>:<encoding>" form Flask-Compress sends out"""
+    if_none_match = request.if_none_match
+    return if_none_match.contains(etag) or any(tag.startswith(etag + ":") for tag in if_none_match)
+
+def cached(key: str, ttl_s: float = RESPONSE_TTL):
+    """Serve an endpoint's encoded body from _cache for up to ttl_s seconds, answering 304 on a matching ETag"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            entry = _cache.get(key)
+            if entry is None or entry[0] <= now:
+                body = view(*args, **kwargs).get_data()
+                entry = (now + ttl_s, body, hashlib.blake2b(body, digest_size=16).hexdigest())
+                _cache[key] = entry
+            
+            if _etag_matches(entry[2]):
+                response = Response(status=304)
+            else:
+                response = Response(entry[1], mimetype='application/json')
+            response.set_etag(entry[2])
+            response.headers['Cache-Control'] = f'public, max-age={int(ttl_s)}'
+            return response
+        return wrapper
+    return decorator
+
+def _invalidate_cache():
+    """Drop cached responses once a finished game changes ratings and progress"""
+    _cache.clear()
+
 @app.route('/')
 def index():
     """Serve the main visualization page"""
@@ -31,13 +138,14 @@ def stats():
     return render_template('stats.html')
 
 @app.route('/api/leaderboard')
+@cached('leaderboard')
 def get_leaderboard():
     """Get current leaderboard data"""
     stats = elo_system.get_statistics()
     leaderboard = stats.get("leaderboard", elo_system.get_leaderboard())
     model_stats = stats.get("model_stats", {})
     
-    return jsonify({
+    return _json_response({
         "leaderboard": [
             {
                 "rank": i + 1,
@@ -52,106 +160,127 @@ def get_leaderboard():
     })
 
 @app.route('/api/games')
+@cached('games')
 def get_games():
     """Get list of game logs"""
-    game_logs_dir = Config.BASE_DIR / "game_logs"
     games = []
     
-    if game_logs_dir.exists():
-        for game_file in sorted(game_logs_dir.glob("*.json"), reverse=True)[:50]:
+    if _GAME_LOGS_DIR.exists():
+        # Summary sidecars are read instead of the full log; older logs may not have one
+        sidecars = set(os.listdir(_GAME_SUMMARIES_DIR)) if _GAME_SUMMARIES_DIR.exists() else set()
+        entries = [entry for entry in os.scandir(_GAME_LOGS_DIR) if entry.name.endswith(".json") and entry.is_file()]
+        
+        # Newest 50 logs via a bounded heap; DirEntry caches its stat() so each file is only stat'ed once
+        newest = heapq.nlargest(50, entries, key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in newest:
+            mtime_ns = entry.stat().st_mtime_ns
+            hit = _game_summary_cache.get(entry.path)
+            if hit is not None and hit[0] == mtime_ns:
+                games.append(hit[1])
+                continue
+            source = _GAME_SUMMARIES_DIR / entry.name if entry.name in sidecars else entry.path
             try:
-                with open(game_file, 'r') as f:
-                    game_data = json.load(f)
-                    games.append({
-                        "game_id": game_data.get("game_id"),
-                        "players": game_data.get("players"),
-                        "winner": game_data.get("winner_model"),
-                        "total_turns": game_data.get("total_turns"),
-                        "start_time": game_data.get("start_time"),
-                        "end_time": game_data.get("end_time")
-                    })
+                with open(source, 'rb') as f:
+                    game_data = orjson.loads(f.read())
+                summary = {
+                    "game_id": game_data.get("game_id"),
+                    "players": game_data.get("players"),
+                    "winner": game_data.get("winner_model"),
+                    "total_turns": game_data.get("total_turns"),
+                    "start_time": game_data.get("start_time"),
+                    "end_time": game_data.get("end_time")
+                }
+                _game_summary_cache[entry.path] = (mtime_ns, summary)
+                games.append(summary)
             except Exception as e:
-                logger.error(f"Error loading game {game_file}: {e}")
+                logger.error(f"Error loading game {entry.path}: {e}")
+        
+        # Drop summaries of logs that fell out of the listing so the cache stays bounded
+        listed = {entry.path for entry in newest}
+        for path in _game_summary_cache.keys() - listed:
+            _game_summary_cache.pop(path, None)
     
-    return jsonify(games)
+    return _json_response(games)
 
 @app.route('/api/elo-rankings')
+@cached('elo_rankings')
 def get_elo_rankings():
     """Get current ELO rankings"""
-    elo_file = Config.BASE_DIR / "elo_rankings.json"
-    
-    if elo_file.exists():
-        with open(elo_file, 'r') as f:
-            return jsonify(json.load(f))
+    if _ELO_FILE.exists():
+        return _json_response(_load_json(str(_ELO_FILE), _ELO_FILE.stat().st_mtime_ns))
     else:
-        return jsonify({"ratings": {}, "history": []})
+        return _json_response({"ratings": {}, "history": []})
 
 @app.route('/api/tournament-progress')
+@cached('tournament_progress')
 def get_tournament_progress():
     """Get tournament progress from saved file"""
-    progress_file = Config.BASE_DIR / "tournament_progress.json"
-    
-    if progress_file.exists():
-        with open(progress_file, 'r') as f:
-            data = json.load(f)
-            
-            # Calculate progress stats
-            models = data.get("models", [])
-            games_per_matchup = data.get("games_per_matchup", 1)
-            total_games = len(models) * (len(models) - 1) * games_per_matchup
-            completed_games = len(data.get("completed_matchups", []))
-            
-            return jsonify({
-                "progress": {
-                    "models": len(models),
-                    "games_per_matchup": games_per_matchup,
-                    "total": total_games,
-                    "completed": completed_games,
-                    "last_updated": data.get("last_updated")
-                }
-            })
+    if _PROGRESS_FILE.exists():
+        data = _load_json(str(_PROGRESS_FILE), _PROGRESS_FILE.stat().st_mtime_ns)
+        
+        # Calculate progress stats
+        models = data.get("models", [])
+        games_per_matchup = data.get("games_per_matchup", 1)
+        total_games = len(models) * (len(models) - 1) * games_per_matchup
+        completed_games = len(data.get("completed_matchups", []))
+        
+        # Games finished since the last snapshot are only in the append log
+        if _PROGRESS_LOG.exists():
+            completed_games += _count_lines(str(_PROGRESS_LOG), _PROGRESS_LOG.stat().st_mtime_ns)
+        
+        return _json_response({
+            "progress": {
+                "models": len(models),
+                "games_per_matchup": games_per_matchup,
+                "total": total_games,
+                "completed": completed_games,
+                "last_updated": data.get("last_updated")
+            }
+        })
     else:
-        return jsonify({"progress": None})
+        return _json_response({"progress": None})
 
 @app.route('/api/recent-games')
+@cached('recent_games')
 def get_recent_games():
     """Get recent games from history"""
-    elo_file = Config.BASE_DIR / "elo_rankings.json"
     games = []
     
-    if elo_file.exists():
-        with open(elo_file, 'r') as f:
-            data = json.load(f)
-            history = data.get("history", [])
-            
-            # Get last 10 games
-            for game in history[-10:]:
-                games.append({
-                    "winner": game.get("winner"),
-                    "loser": game.get("loser"),
-                    "timestamp": game.get("timestamp"),
-                    "winner_rating_after": game.get("winner_rating_after"),
-                    "loser_rating_after": game.get("loser_rating_after"),
-                    "total_turns": game.get("total_turns", "N/A")
-                })
+    if _ELO_FILE.exists():
+        data = _load_json(str(_ELO_FILE), _ELO_FILE.stat().st_mtime_ns)
+        history = data.get("history", [])
+        
+        # Get last 10 games
+        for game in history[-10:]:
+            games.append({
+                "winner": game.get("winner"),
+                "loser": game.get("loser"),
+                "timestamp": game.get("timestamp"),
+                "winner_rating_after": game.get("winner_rating_after"),
+                "loser_rating_after": game.get("loser_rating_after"),
+                "total_turns": game.get("total_turns", "N/A")
+            })
     
-    return jsonify({"games": list(reversed(games))})
+    return _json_response({"games": list(reversed(games))})
 
 @app.route('/api/game/<game_id>')
 def get_game_details(game_id):
     """Get detailed game log"""
-    game_file = Config.BASE_DIR / "game_logs" / f"{game_id}.json"
+    game_file = _GAME_LOGS_DIR / f"{game_id}.json"
     
     if game_file.exists():
-        with open(game_file, 'r') as f:
-            return jsonify(json.load(f))
+        # Serve the file as-is (no parse/re-encode); conditional=True answers revalidations with 304
+        response = send_from_directory(_GAME_LOGS_DIR, game_file.name, mimetype='application/json', conditional=True)
+        # Game logs are written once when the game ends
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        return response
     else:
-        return jsonify({"error": "Game not found"}), 404
+        return _json_response({"error": "Game not found"}, 404)
 
 @app.route('/api/active-games')
 def get_active_games():
     """Get currently running games"""
-    return jsonify([
+    return _json_response([
         {
             "game_id": game_id,
             "players": game_info["players"],
@@ -170,20 +299,20 @@ def handle_game_event():
         event_type = data.get('type')
         event_data = data.get('data', {})
         
-        # Broadcast to all connected clients
+        # Broadcast to all connected clients. Actions are only queued for the batch broadcaster;
+        # other events are emitted off the request thread so the evaluator isn't held up by the fanout
         logger.info(f"Broadcasting {event_type} for game {game_id}")
-        socketio.emit('game_update', {
-            "game_id": game_id,
-            "type": event_type,
-            "data": event_data,
-            "timestamp": data.get('timestamp', datetime.now().isoformat())
-        })
+        if event_type == 'action':
+            broadcast_game_update(game_id, event_type, event_data, data.get('timestamp'))
+        else:
+            socketio.start_background_task(broadcast_game_update, game_id, event_type, event_data, data.get('timestamp'))
         
         # Handle specific event types
         if event_type == 'game_start':
-            notify_game_start(game_id, event_data.get('players', {}))
+            _register_game(game_id, event_data.get('players', {}))
         elif event_type == 'game_end':
             active_games.pop(game_id, None)
+            _invalidate_cache()
         
         return jsonify({"success": True})
     except Exception as e:
@@ -196,36 +325,87 @@ def handle_connect(auth=None):
     logger.info(f"Client connected: {request.sid}")
     emit('connected', {"message": "Connected to Catan LLM Evaluation server"})
 
+@socketio.on('watch_game')
+def handle_watch_game(data):
+    """Subscribe the client to one game's action updates"""
+    game_id = (data or {}).get('game_id')
+    if game_id:
+        join_room(game_id)
+
+@socketio.on('watch_leaderboard')
+def handle_watch_leaderboard(data=None):
+    """Subscribe the client to leaderboard updates"""
+    join_room('leaderboard')
+
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle client disconnection"""
     logger.info(f"Client disconnected: {request.sid}")
 
-def broadcast_game_update(game_id: str, update_type: str, data: dict):
-    """Broadcast game updates to all connected clients"""
-    socketio.emit('game_update', {
-        "game_id": game_id,
-        "type": update_type,
-        "data": data,
-        "timestamp": datetime.now().isoformat()
-    })
+def broadcast_game_update(game_id: str, update_type: str, data: dict, timestamp: Optional[str] = None):
+    """Broadcast game updates - actions go in batches to the game's room, lifecycle events to everyone"""
+    # Frames use short keys (t=type, d=data, ts=timestamp, g=game_id); the web client expands them
+    payload = {
+        "t": update_type,
+        "d": data,
+        "ts": timestamp or datetime.now().isoformat()
+    }
+    if update_type == "action":
+        # The game id is carried once per batch rather than per action
+        _pending_actions[game_id].append(payload)
+        return
+    
+    # Send anything still buffered first so clients see events in order
+    payload["g"] = game_id
+    with _broadcast_lock:
+        flush_game_actions(game_id)
+        if update_type == "game_end":
+            _pending_actions.pop(game_id, None)
+        socketio.emit('game_update', _encode_event(payload))
+
+def flush_game_actions(game_id: str):
+    """Broadcast a game's buffered action updates as one game_update_batch frame"""
+    with _broadcast_lock:
+        queue = _pending_actions.get(game_id)
+        if not queue:
+            return
+        
+        actions = []
+        try:
+            while True:
+                actions.append(queue.popleft())
+        except IndexError:
+            pass
+        
+        socketio.emit('game_update_batch', _encode_event({"g": game_id, "a": actions}), room=game_id)
+
+def _broadcast_actions_forever():
+    """Background task draining the per-game action buffers"""
+    while True:
+        socketio.sleep(BROADCAST_INTERVAL)
+        for game_id in list(_pending_actions):
+            flush_game_actions(game_id)
 
 def broadcast_leaderboard_update():
-    """Broadcast leaderboard updates"""
+    """Broadcast leaderboard updates to clients watching the leaderboard"""
     stats = elo_system.get_statistics()
     socketio.emit('leaderboard_update', {
         "leaderboard": stats["leaderboard"],
         "timestamp": datetime.now().isoformat()
-    })
+    }, room='leaderboard')
 
 # Game lifecycle notifications
-def notify_game_start(game_id: str, players: dict):
-    """Notify clients when a game starts"""
+def _register_game(game_id: str, players: dict):
+    """Track a started game for /api/active-games"""
     active_games[game_id] = {
         "players": players,
         "current_turn": 0,
         "started": datetime.now().isoformat()
     }
+
+def notify_game_start(game_id: str, players: dict):
+    """Notify clients when a game starts"""
+    _register_game(game_id, players)
     broadcast_game_update(game_id, "game_start", {
         "players": players
     })
@@ -241,6 +421,7 @@ def notify_game_end(game_id: str, winner: str, stats: dict):
     """Notify clients when a game ends"""
     if game_id in active_games:
         del active_games[game_id]
+    _invalidate_cache()
     
     broadcast_game_update(game_id, "game_end", {
         "winner": winner,
@@ -253,4 +434,9 @@ def notify_game_end(game_id: str, winner: str, stats: dict):
 def run_server():
     """Run the web server"""
     logger.info(f"Starting web server on {Config.APP_HOST}:{Config.APP_PORT}")
-    socketio.run(app, host=Config.APP_HOST, port=Config.APP_PORT, debug=Config.APP_DEBUG, allow_unsafe_werkzeug=True)
\ No newline at end of file
+    socketio.start_background_task(_broadcast_actions_forever)
+    if socketio.async_mode == 'threading':
+        socketio.run(app, host=Config.APP_HOST, port=Config.APP_PORT, debug=Config.APP_DEBUG, allow_unsafe_werkzeug=True)
+    else:
+        # eventlet/gevent serve with their own cooperative WSGI server
+        socketio.run(app, host=Config.APP_HOST, port=Config.APP_PORT, debug=Config.APP_DEBUG)
\ No newline at end of file
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Resumable tournament manager - runs in chunks and saves progress"""
 
-import json
+import orjson
 import sys
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
+from functools import cached_property
 from typing import List, Dict, Optional, Tuple
 import time
 
@@ -21,7 +23,14 @@ class ResumableTournament:
         self.models = models
         self.games_per_matchup = games_per_matchup
         self.progress_file = Path("tournament_progress.json")
+        # Results are appended here per game and folded into progress_file every snapshot_every games
+        self.progress_log = Path("tournament_progress.jsonl")
+        self.snapshot_every = 25
         self.completed_matchups = []
+        self.completed_ids = set()
+        # Standings counters, kept in step with completed_matchups
+        self.wins = Counter()
+        self.games_played = Counter()
         self.pending_matchups = []
         self.current_session_results = []
         
@@ -29,18 +38,49 @@ class ResumableTournament:
         self.load_progress()
         
     def load_progress(self):
-        """Load tournament progress from file"""
+        """Load tournament progress from the snapshot, then replay the append log"""
+        fresh = not self.progress_file.exists() and not self.progress_log.exists()
         if self.progress_file.exists():
-            with open(self.progress_file, 'r') as f:
-                data = json.load(f)
+            with open(self.progress_file, 'rb') as f:
+                data = orjson.loads(f.read())
                 self.completed_matchups = data.get("completed_matchups", [])
-                print(f"📂 Loaded progress: {len(self.completed_matchups)} matchups completed")
-        else:
+        self.completed_ids = {m.get("matchup_id") for m in self.completed_matchups}
+        
+        skipped_lines = False
+        if self.progress_log.exists():
+            # Entries may already be in the snapshot if we stopped between writing it and truncating the log
+            with open(self.progress_log, 'rb') as f:
+                for line_num, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        matchup = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # Most likely a line cut short when the process was killed mid-write
+                        print(f"⚠️  Skipping unreadable line {line_num} in {self.progress_log}")
+                        skipped_lines = True
+                        continue
+                    if matchup.get("matchup_id") not in self.completed_ids:
+                        self.completed_ids.add(matchup.get("matchup_id"))
+                        self.completed_matchups.append(matchup)
+        
+        for matchup in self.completed_matchups:
+            self._count_result(matchup)
+        
+        if skipped_lines:
+            # Fold the readable entries into a snapshot so new appends don't land on the torn line
+            self.save_progress()
+        
+        if fresh:
             print("🆕 Starting fresh tournament")
+            # Results only go to the append log, so write the snapshot now for the dashboard to find
+            self.save_progress()
+        else:
+            print(f"📂 Loaded progress: {len(self.completed_matchups)} matchups completed")
             
-    def save_progress(self):
-        """Save current tournament progress"""
-        data = {
+    def _progress_data(self) -> Dict:
+        """Snapshot of the tournament state written to the progress file"""
+        return {
             "models": self.models,
             "games_per_matchup": self.games_per_matchup,
             "completed_matchups": self.completed_matchups,
@@ -48,10 +88,49 @@ class ResumableTournament:
             "total_games_completed": len(self.completed_matchups),
             "session_results": self.current_session_results
         }
-        with open(self.progress_file, 'w') as f:
-            json.dump(data, f, indent=2)
+    
+    def record_result(self, matchup_result: Dict):
+        """Append one game's result to the progress log, snapshotting periodically"""
+        self.completed_matchups.append(matchup_result)
+        self.completed_ids.add(matchup_result["matchup_id"])
+        self.current_session_results.append(matchup_result)
+        self._count_result(matchup_result)
+        
+        with open(self.progress_log, 'ab') as f:
+            f.write(orjson.dumps(matchup_result) + b"\n")
+        
+        if len(self.completed_matchups) % self.snapshot_every == 0:
+            self.save_progress()
+        else:
+            print(f"💾 Progress logged: {len(self.completed_matchups)} games completed")
+    
+    def _count_result(self, matchup: Dict):
+        """Add one completed matchup to the standings counters"""
+        model1 = matchup.get("model1")
+        model2 = matchup.get("model2")
+        if model1 and model2:
+            self.games_played[model1] += 1
+            self.games_played[model2] += 1
+        
+        winner = matchup.get("winner")
+        if winner:
+            self.wins[winner] += 1
+    
+    def _write_snapshot(self, option: int = 0):
+        """Write the full progress file and drop the log entries it now contains"""
+        with open(self.progress_file, 'wb') as f:
+            f.write(orjson.dumps(self._progress_data(), option=option))
+        self.progress_log.unlink(missing_ok=True)
         print(f"💾 Progress saved: {len(self.completed_matchups)} games completed")
     
+    def save_progress(self):
+        """Save current tournament progress (compact)"""
+        self._write_snapshot()
+    
+    def save_progress_pretty(self):
+        """Save current tournament progress indented for human inspection"""
+        self._write_snapshot(orjson.OPT_INDENT_2)
+    
     def generate_all_matchups(self) -> List[Tuple[str, str]]:
         """Generate all possible matchups"""
         matchups = []
@@ -62,18 +141,17 @@ class ResumableTournament:
                         matchups.append((model1, model2, game_num))
         return matchups
     
+    @cached_property
+    def all_matchups(self) -> List[Tuple[str, str, int]]:
+        """All matchups, computed once (models and games_per_matchup don't change)"""
+        return self.generate_all_matchups()
+    
     def get_pending_matchups(self) -> List[Tuple[str, str, int]]:
         """Get list of matchups that haven't been played yet"""
-        all_matchups = self.generate_all_matchups()
-        pending = []
-        
-        for matchup in all_matchups:
-            # Check if this exact matchup has been completed
-            matchup_id = f"{matchup[0]}_vs_{matchup[1]}_game{matchup[2]}"
-            if not any(m.get("matchup_id") == matchup_id for m in self.completed_matchups):
-                pending.append(matchup)
-                
-        return pending
+        return [
+            matchup for matchup in self.all_matchups
+            if f"{matchup[0]}_vs_{matchup[1]}_game{matchup[2]}" not in self.completed_ids
+        ]
     
     def run_chunk(self, chunk_size: int = 5):
         """Run a chunk of games"""
@@ -96,7 +174,7 @@ class ResumableTournament:
         
         for i, (model1, model2, game_num) in enumerate(games_in_chunk):
             print(f"\n🎮 Game {i+1}/{len(games_in_chunk)} in this chunk")
-            print(f"📍 Overall progress: {len(self.completed_matchups) + i + 1}/{len(self.generate_all_matchups())}")
+            print(f"📍 Overall progress: {len(self.completed_matchups) + 1}/{len(self.all_matchups)}")
             
             try:
                 # Run the game
@@ -115,11 +193,8 @@ class ResumableTournament:
                     "timestamp": datetime.now().isoformat()
                 }
                 
-                self.completed_matchups.append(matchup_result)
-                self.current_session_results.append(matchup_result)
-                
-                # Save progress after each game
-                self.save_progress()
+                # Log progress after each game
+                self.record_result(matchup_result)
                 
                 # Small delay between games
                 time.sleep(2)
@@ -127,35 +202,14 @@ class ResumableTournament:
             except Exception as e:
                 print(f"❌ Error in game {model1} vs {model2}: {e}")
                 # Continue with next game
+        
+        # Fold this chunk's log entries into the snapshot
+        self.save_progress()
                 
         return True  # More games remaining
     
     def print_current_standings(self):
         """Print current tournament standings based on completed games"""
-        # Count wins for each model
-        wins = {}
-        games_played = {}
-        
-        for matchup in self.completed_matchups:
-            winner = matchup.get("winner")
-            model1 = matchup.get("model1")
-            model2 = matchup.get("model2")
-            
-            # Initialize counters
-            for model in [model1, model2]:
-                if model not in wins:
-                    wins[model] = 0
-                    games_played[model] = 0
-                    
-            # Count the game
-            if model1 and model2:
-                games_played[model1] += 1
-                games_played[model2] += 1
-                
-            # Count the win
-            if winner:
-                wins[winner] = wins.get(winner, 0) + 1
-                
         print("\n🏆 Current Standings:")
         print("-" * 60)
         print(f"{'Model':<35} {'Games':>8} {'Wins':>8} {'Win Rate':>8}")
@@ -164,11 +218,9 @@ class ResumableTournament:
         # Sort by win rate
         standings = []
         for model in self.models:
-            if model in games_played and games_played[model] > 0:
-                win_rate = wins.get(model, 0) / games_played[model]
-                standings.append((model, games_played[model], wins.get(model, 0), win_rate))
-            else:
-                standings.append((model, 0, 0, 0.0))
+            games = self.games_played[model]
+            win_count = self.wins[model]
+            standings.append((model, games, win_count, win_count / games if games else 0.0))
                 
         standings.sort(key=lambda x: x[3], reverse=True)
         
@@ -235,7 +287,7 @@ def main():
             
     except KeyboardInterrupt:
         print("\n\n⏸️  Tournament paused")
-        tournament.save_progress()
+        tournament.save_progress_pretty()
         tournament.print_current_standings()
         pending = tournament.get_pending_matchups()
         print(f"\n📋 {len(pending)} games remaining")
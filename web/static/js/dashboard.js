@@ -1,5 +1,18 @@
 // Minimal Catan Dashboard
 
+// game_update frames arrive as MessagePack with short keys (g, t, d, ts)
+function expandUpdate(frame, gameId) {
+    return { game_id: gameId, type: frame.t, data: frame.d, timestamp: frame.ts };
+}
+function decodeUpdate(buffer) {
+    const frame = MessagePack.decode(buffer);
+    return expandUpdate(frame, frame.g);
+}
+function decodeBatch(buffer) {
+    const batch = MessagePack.decode(buffer);
+    return batch.a.map(frame => expandUpdate(frame, batch.g));
+}
+
 class CatanDashboard {
     constructor() {
         this.socket = null;
@@ -20,6 +33,10 @@ class CatanDashboard {
         this.socket.on('connect', () => {
             console.log('Connected to server');
             this.updateConnectionStatus(true);
+            // Rooms don't survive a reconnect, so resubscribe to the game on screen
+            if (this.currentGameId) {
+                this.socket.emit('watch_game', { game_id: this.currentGameId });
+            }
             // Request current game state on reconnection
             this.checkForActiveGame();
         });
@@ -29,10 +46,16 @@ class CatanDashboard {
             this.updateConnectionStatus(false);
         });
 
-        this.socket.on('game_update', (data) => {
+        this.socket.on('game_update', (buffer) => {
+            const data = decodeUpdate(buffer);
             console.log('Received game_update:', data);
             this.handleGameUpdate(data);
         });
+
+        // Actions arrive batched; each entry has the same shape as a game_update
+        this.socket.on('game_update_batch', (buffer) => {
+            decodeBatch(buffer).forEach(update => this.handleGameUpdate(update));
+        });
     }
 
     updateConnectionStatus(connected) {
@@ -110,6 +133,8 @@ class CatanDashboard {
 
     showGame(gameId, gameData) {
         this.currentGameId = gameId;
+        // Action updates are only sent to clients watching the game
+        this.socket.emit('watch_game', { game_id: gameId });
         
         // Hide waiting state, show game state
         document.getElementById('waiting-state').style.display = 'none';